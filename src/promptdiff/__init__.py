@@ -1,15 +1,32 @@
 """promptdiff - Git-style diff and version control for LLM prompts."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.1"
 
-from promptdiff.store import PromptStore
-from promptdiff.diff import PromptDiff
-from promptdiff.registry import PromptRegistry
-from promptdiff.changelog import ChangelogGenerator
-from promptdiff.eval import PromptTestCase
+if TYPE_CHECKING:
+    from promptdiff.changelog import ChangelogGenerator
+    from promptdiff.diff import PromptDiff
+    from promptdiff.eval import PromptTestCase
+    from promptdiff.registry import PromptRegistry
+    from promptdiff.store import PromptStore
 
-# Backward-compatible alias
-TestCase = PromptTestCase
+    # Backward-compatible alias
+    TestCase = PromptTestCase
+
+# Public names are imported on first access, so ``import promptdiff`` (and the
+# CLI, which only needs ``__version__``) does not load every submodule.
+_LAZY_EXPORTS = {
+    "PromptStore": ("promptdiff.store", "PromptStore"),
+    "PromptDiff": ("promptdiff.diff", "PromptDiff"),
+    "PromptRegistry": ("promptdiff.registry", "PromptRegistry"),
+    "ChangelogGenerator": ("promptdiff.changelog", "ChangelogGenerator"),
+    "PromptTestCase": ("promptdiff.eval", "PromptTestCase"),
+    "TestCase": ("promptdiff.eval", "PromptTestCase"),
+}
 
 __all__ = [
     "PromptStore",
@@ -20,3 +37,17 @@ __all__ = [
     "TestCase",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module 'promptdiff' has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
 
 from promptdiff.diff import PromptDiff
 from promptdiff.store import PromptStore
 
+# generate_all renders prompts concurrently; the work is mostly file reads,
+# which release the GIL.
+MAX_CHANGELOG_WORKERS = 32
+
 
 class ChangelogGenerator:
     """Generate changelogs from prompt version history."""
 
-    def __init__(self, store: PromptStore) -> None:
-        """Create a changelog generator backed by the given store."""
+    def __init__(self, store: PromptStore, use_embeddings: bool = False) -> None:
+        """Create a changelog generator backed by the given store.
+
+        Args:
+            store: The prompt store to read version history from.
+            use_embeddings: Report embedding-based semantic similarity instead
+                of Jaccard word overlap (requires the ``embeddings`` extra).
+        """
         self.store = store
+        self.use_embeddings = use_embeddings
         self.differ = PromptDiff()
 
     def generate(self, name: str, last_n: int | None = None) -> str:
@@ -25,53 +40,81 @@ class ChangelogGenerator:
         Returns:
             A Markdown-formatted changelog string.
         """
-        versions = self.store.list_versions(name)
+        buf = io.StringIO()
+        self._write_changelog(buf, name, last_n, preload=last_n is None)
+        return buf.getvalue()
+
+    def _generate_lazy(self, name: str) -> str:
+        """Generate the full changelog for *name* inside a ``generate_all`` worker.
+
+        Versions are read one by one as they are diffed rather than preloaded,
+        so workers do not each open the store's parallel read pool.
+        """
+        buf = io.StringIO()
+        self._write_changelog(buf, name, None, preload=False)
+        return buf.getvalue()
+
+    def _write_changelog(
+        self, buf: io.StringIO, name: str, last_n: int | None, preload: bool
+    ) -> None:
+        """Write the changelog for *name* into *buf* (see :meth:`generate`)."""
+        versions = self.store.list_versions(name, preload=preload)
         if last_n is not None:
             versions = versions[-last_n:]
 
-        lines = [f"# Changelog: {name}", ""]
+        if self.use_embeddings:
+            # Embed every version in one request; full_diff then hits the cache.
+            self.differ.batch_embedding_similarity(
+                [(prev.content, v.content) for prev, v in pairwise(versions)]
+            )
+
+        w = buf.write
+        w(f"# Changelog: {name}\n")
 
         for i in range(len(versions) - 1, -1, -1):
             v = versions[i]
-            ts = v.timestamp[:10] if v.timestamp else "unknown"
+            ts = v.date or "unknown"
             msg = v.message or "No description"
-            lines.append(f"## v{v.version} ({ts})")
-            lines.append("")
-            lines.append(f"**{msg}**")
-            lines.append("")
+            w(f"\n## v{v.version} ({ts})\n\n**{msg}**\n\n")
 
             if i > 0:
                 prev = versions[i - 1]
                 diff = self.differ.full_diff(
-                    prev.content, v.content, prev.version, v.version
-                )
-                lines.append(
-                    f"- Text similarity: {diff.similarity_ratio:.1%}"
+                    prev.content,
+                    v.content,
+                    prev.version,
+                    v.version,
+                    use_embeddings=self.use_embeddings,
+                    fast=True,
                 )
+                w(f"- Text similarity: {diff.similarity_ratio:.1%}\n")
                 if diff.semantic_similarity is not None:
-                    lines.append(
-                        f"- Semantic similarity: {diff.semantic_similarity:.1%}"
-                    )
-                lines.append(
-                    f"- Changes: +{diff.stats['additions']} -{diff.stats['deletions']}"
-                )
+                    w(f"- Semantic similarity: {diff.semantic_similarity:.1%}\n")
+                w(f"- Changes: +{diff.stats['additions']} -{diff.stats['deletions']}\n")
             else:
-                lines.append("- Initial version")
-
-            lines.append("")
-
-        return "\n".join(lines)
+                w("- Initial version\n")
 
     def generate_all(self) -> str:
-        """Generate a combined Markdown changelog covering every prompt in the store."""
+        """Generate a combined Markdown changelog covering every prompt in the store.
+
+        Prompts are independent, so their changelogs are rendered on a thread
+        pool and then joined in name order.
+        """
         prompts = self.store.list_prompts()
         if not prompts:
             return "# Changelog\n\nNo prompts tracked yet.\n"
 
-        sections = ["# Prompt Changelog", ""]
-        for name in prompts:
-            sections.append(self.generate(name))
-            sections.append("---")
-            sections.append("")
-
-        return "\n".join(sections)
+        workers = min(MAX_CHANGELOG_WORKERS, (os.cpu_count() or 1) * 4, len(prompts))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                sections = list(pool.map(self._generate_lazy, prompts))
+        else:
+            sections = [self.generate(name) for name in prompts]
+
+        buf = io.StringIO()
+        buf.write("# Prompt Changelog\n")
+        for section in sections:
+            buf.write("\n")
+            buf.write(section)
+            buf.write("\n---\n")
+        return buf.getvalue()
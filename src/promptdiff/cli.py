@@ -8,14 +8,13 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from promptdiff import __version__
-from promptdiff.changelog import ChangelogGenerator
-from promptdiff.diff import PromptDiff
-from promptdiff.eval import PromptEvaluator, TestCase
 from promptdiff.store import PromptStore
 
+# Command-specific modules (rich.table, diff, changelog, eval, registry) are
+# imported inside the commands that use them to keep CLI start-up fast.
+
 console = Console()
 
 
@@ -79,6 +78,8 @@ def add(name: str, message: str, file_path: str | None, tag: tuple[str, ...]) ->
 @click.argument("v2", type=int)
 def diff_cmd(name: str, v1: int, v2: int) -> None:
     """Show diff between two prompt versions."""
+    from promptdiff.diff import PromptDiff
+
     store = _get_store()
     differ = PromptDiff()
 
@@ -120,17 +121,19 @@ def log(name: str) -> None:
         console.print(f"[yellow]No versions found for '{name}'[/yellow]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"Prompt: {name}")
     table.add_column("Version", style="cyan", justify="right")
     table.add_column("Hash", style="dim")
     table.add_column("Date", style="green")
     table.add_column("Message")
 
-    for v in reversed(versions):
+    for v in versions[::-1]:
         table.add_row(
             f"v{v.version}",
             v.content_hash,
-            v.timestamp[:10] if v.timestamp else "",
+            v.date,
             v.message or "-",
         )
 
@@ -147,6 +150,8 @@ def list_cmd() -> None:
         console.print("[yellow]No prompts tracked yet.[/yellow]")
         return
 
+    from rich.table import Table
+
     table = Table(title="Tracked Prompts")
     table.add_column("Name", style="cyan")
     table.add_column("Versions", justify="right")
@@ -166,6 +171,8 @@ def list_cmd() -> None:
 @click.option("-n", "--last", type=int, default=None, help="Only last N versions")
 def changelog(name: str, last: int | None) -> None:
     """Generate changelog for a prompt."""
+    from promptdiff.changelog import ChangelogGenerator
+
     store = _get_store()
     gen = ChangelogGenerator(store)
     output = gen.generate(name, last_n=last)
@@ -182,6 +189,8 @@ def eval_cmd(name: str, version: int) -> None:
     so it will always score ~100%. For real evaluation, use the Python API
     with custom test cases and an LLM runner. See the README for details.
     """
+    from promptdiff.eval import PromptEvaluator, TestCase
+
     store = _get_store()
     v = store.get_version(name, version)
 
@@ -225,7 +234,7 @@ def export_cmd(name: str | None, output_path: str | None, fmt: str) -> None:
     export_data: list[dict] = []
     for pname in prompts_to_export:
         try:
-            versions = store.list_versions(pname)
+            versions = store.list_versions(pname, preload=True)
         except FileNotFoundError:
             console.print(f"[red]Prompt '{pname}' not found.[/red]")
             raise SystemExit(1)
@@ -271,19 +280,17 @@ def search_cmd(query: str, tag_filter: str | None, search_content: bool) -> None
     within prompt text. Use --tag to filter by tag.
     """
     store = _get_store()
-    from promptdiff.registry import PromptRegistry
-    registry = PromptRegistry(store)
 
-    prompts = store.list_prompts()
-    if not prompts:
+    metas = store.batch_read_meta()
+    if not metas:
         console.print("[yellow]No prompts tracked yet.[/yellow]")
         return
 
     results: list[dict] = []
     query_lower = query.lower()
 
-    for pname in prompts:
-        tags = registry.get_tags(pname)
+    for pname, meta in metas.items():
+        tags = meta.get("tags", [])
 
         # Tag filter: skip if tag doesn't match
         if tag_filter and tag_filter not in tags:
@@ -315,11 +322,10 @@ def search_cmd(query: str, tag_filter: str | None, search_content: bool) -> None
                 pass
 
         if matched:
-            meta = store._read_meta(pname)
             results.append({
                 "name": pname,
                 "match": match_reason,
-                "versions": len(meta.get("versions", [])),
+                "versions": meta.get("latest_version", 0),
                 "tags": tags,
             })
 
@@ -327,6 +333,8 @@ def search_cmd(query: str, tag_filter: str | None, search_content: bool) -> None
         console.print(f"[yellow]No prompts matching '{query}'.[/yellow]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"Search: '{query}'")
     table.add_column("Name", style="cyan")
     table.add_column("Match", style="green")
@@ -374,25 +382,27 @@ def import_cmd(file_path: str, merge: bool) -> None:
     imported = 0
     skipped = 0
 
-    for record in data:
-        pname = record["name"]
-        existing = store.list_prompts()
-        if pname in existing and not merge:
-            console.print(f"[yellow]Skipping '{pname}' (already exists, use --merge to add versions)[/yellow]")
-            skipped += 1
-            continue
-
-        for v in record.get("versions", []):
-            store.add(
-                pname,
-                v["content"],
-                message=v.get("message", ""),
-                metadata=v.get("metadata"),
-            )
-            imported += 1
-
-        if record.get("tags"):
-            registry.set_tags(pname, record["tags"])
+    # One round of fsyncs for the whole import on durable stores.
+    with store.batch():
+        for record in data:
+            pname = record["name"]
+            existing = store.list_prompts()
+            if pname in existing and not merge:
+                console.print(f"[yellow]Skipping '{pname}' (already exists, use --merge to add versions)[/yellow]")
+                skipped += 1
+                continue
+
+            for v in record.get("versions", []):
+                store.add(
+                    pname,
+                    v["content"],
+                    message=v.get("message", ""),
+                    metadata=v.get("metadata"),
+                )
+                imported += 1
+
+            if record.get("tags"):
+                registry.set_tags(pname, record["tags"])
 
     console.print(f"[green]Imported {imported} version(s), skipped {skipped} prompt(s).[/green]")
 
@@ -3,12 +3,258 @@
 from __future__ import annotations
 
 import difflib
-from dataclasses import dataclass, field
-
-
-@dataclass
+import functools
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+# Maximum number of normalized embedding vectors kept per ``PromptDiff`` instance.
+EMBEDDING_CACHE_SIZE = 1024
+
+# Cache misses go to the embeddings API in requests of at most this many inputs
+# and characters (about 150k tokens), below the API's per-request limits.
+EMBEDDING_BATCH_SIZE = 2048
+EMBEDDING_BATCH_CHARS = 600_000
+
+# Maximum number of ``full_diff`` results memoized per ``PromptDiff`` instance.
+FULL_DIFF_CACHE_SIZE = 128
+
+# Below this many lines (after trimming common prefix/suffix) the fast diff
+# stays in pure Python; above it, the Numba-compiled step is used if available.
+JIT_MIN_LINES = 1000
+
+# One-byte line tags stored in ``DiffResult.tags``.
+TAG_EQUAL = b"e"
+TAG_DELETE = b"d"
+TAG_INSERT = b"i"
+
+
+@functools.lru_cache(maxsize=256)
+def _split_lines(text: str) -> tuple[str, ...]:
+    """Split *text* into interned lines (keeping line endings), memoized.
+
+    Interning lets equal lines from different versions compare by identity,
+    and the cache means a version that appears in two consecutive diffs is
+    only split once.
+    """
+    return tuple(sys.intern(line) for line in text.splitlines(keepends=True))
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokens(text: str) -> frozenset[str]:
+    """Return the set of lowercased whitespace-separated words in *text*, memoized.
+
+    Eval suites and changelogs compare the same strings over and over, so
+    each distinct text is tokenized only once.  Words are interned, so a word
+    shared by two texts is the same object in both sets and set intersection
+    matches it by identity instead of comparing characters.
+    """
+    return frozenset(map(sys.intern, text.lower().split()))
+
+
+def _jaccard(text_a: str, text_b: str) -> float:
+    """Jaccard similarity of the lowercased whitespace-separated words of two texts.
+
+    Returns 1.0 when both texts are empty and 0.0 when only one is.  The union
+    size is derived from the intersection, so no union set is built.
+    """
+    words_a = _tokens(text_a)
+    words_b = _tokens(text_b)
+    if not words_a and not words_b:
+        return 1.0
+    if not words_a or not words_b:
+        return 0.0
+    shared = len(words_a & words_b)
+    return shared / (len(words_a) + len(words_b) - shared)
+
+
+def _common_affixes(old_lines: Sequence[str], new_lines: Sequence[str]) -> tuple[int, int]:
+    """Return the lengths of the common leading and trailing runs of two line sequences.
+
+    The two runs never overlap, so for identical inputs the prefix covers
+    everything and the suffix is 0.
+    """
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _myers_step(a: Any, b: Any, v: Any, offset: int, d: int) -> bool:
+    """Extend every furthest-reaching D-path of the Myers edit graph by one edit.
+
+    *v* maps diagonal ``k`` (stored at ``v[k + offset]``) to the furthest x
+    coordinate reached so far and is updated in place.  Returns True once a
+    path reaches the bottom-right corner.
+    """
+    n = len(a)
+    m = len(b)
+    for k in range(-d, d + 1, 2):
+        if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+            x = v[offset + k + 1]
+        else:
+            x = v[offset + k - 1] + 1
+        y = x - k
+        while x < n and y < m and a[x] == b[y]:
+            x += 1
+            y += 1
+        v[offset + k] = x
+        if x >= n and y >= m:
+            return True
+    return False
+
+
+@functools.cache
+def _jitted_myers_step() -> Any:
+    """Return :func:`_myers_step` compiled with Numba, or None if Numba is not installed.
+
+    Imported lazily because Numba takes a noticeable time to load, and only
+    large diffs benefit from it.  ``cache=True`` keeps the compiled code in
+    ``__pycache__`` so the compile cost is paid once per install.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, boundscheck=False)(_myers_step)
+
+
+def _encode_lines(old_lines: Sequence[str], new_lines: Sequence[str]) -> tuple[Any, Any]:
+    """Map lines to int64 ids (equal lines share an id) for the compiled diff step."""
+    import numpy as np
+
+    ids: dict[str, int] = {}
+    encode = ids.setdefault
+    a = np.fromiter((encode(line, len(ids)) for line in old_lines), np.int64, len(old_lines))
+    b = np.fromiter((encode(line, len(ids)) for line in new_lines), np.int64, len(new_lines))
+    return a, b
+
+
+def _grouped_opcodes(
+    opcodes: list[tuple[str, int, int, int, int]], context: int
+) -> list[list[tuple[str, int, int, int, int]]]:
+    """Split opcodes into hunks with up to *context* lines of surrounding context.
+
+    Same grouping as ``SequenceMatcher.get_grouped_opcodes``; opcodes here
+    only distinguish ``"equal"`` runs from changed runs.
+    """
+    if not opcodes:
+        return []
+    codes = list(opcodes)
+    tag, i1, i2, j1, j2 = codes[0]
+    if tag == "equal":
+        codes[0] = (tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+    tag, i1, i2, j1, j2 = codes[-1]
+    if tag == "equal":
+        codes[-1] = (tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+
+    groups: list[list[tuple[str, int, int, int, int]]] = []
+    group: list[tuple[str, int, int, int, int]] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > 2 * context:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    groups.append(group)
+    return [g for g in groups if not (len(g) == 1 and g[0][0] == "equal")]
+
+
+def _format_unified_range(start: int, stop: int) -> str:
+    """Format a ``start,length`` hunk range the way ``difflib.unified_diff`` does."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _myers_backtrack(trace: list[Any], n: int, m: int) -> list[tuple[str, int, int, int, int]]:
+    """Walk a Myers trace back from ``(n, m)`` and return difflib-style opcodes.
+
+    ``trace[d]`` is the slice of the V array for diagonals ``-d - 1 .. d + 1``
+    as it was before edit *d* was taken.
+    """
+    steps: list[str] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        snap = trace[d]
+        base = d + 1
+        k = x - y
+        if k == -d or (k != d and snap[base + k - 1] < snap[base + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = int(snap[base + prev_k])
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            steps.append("equal")
+            x -= 1
+            y -= 1
+        if d > 0:
+            steps.append("insert" if x == prev_x else "delete")
+        x, y = prev_x, prev_y
+    steps.reverse()
+
+    opcodes: list[tuple[str, int, int, int, int]] = []
+    i = j = 0
+    pos = 0
+    while pos < len(steps):
+        i1, j1 = i, j
+        if steps[pos] == "equal":
+            while pos < len(steps) and steps[pos] == "equal":
+                i += 1
+                j += 1
+                pos += 1
+            opcodes.append(("equal", i1, i, j1, j))
+            continue
+        while pos < len(steps) and steps[pos] != "equal":
+            if steps[pos] == "delete":
+                i += 1
+            else:
+                j += 1
+            pos += 1
+        tag = "replace" if i > i1 and j > j1 else ("delete" if i > i1 else "insert")
+        opcodes.append((tag, i1, i, j1, j))
+    return opcodes
+
+
+def _embedding_batches(items: list[tuple[Any, str]]) -> list[list[tuple[Any, str]]]:
+    """Split ``(key, text)`` pairs into batches that fit one embeddings request."""
+    batches: list[list[tuple[Any, str]]] = []
+    batch: list[tuple[Any, str]] = []
+    chars = 0
+    for item in items:
+        size = len(item[1])
+        if batch and (len(batch) == EMBEDDING_BATCH_SIZE or chars + size > EMBEDDING_BATCH_CHARS):
+            batches.append(batch)
+            batch, chars = [], 0
+        batch.append(item)
+        chars += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@dataclass(slots=True, frozen=True)
 class DiffLine:
-    """A single line in a diff output."""
+    """A single line in a diff output.
+
+    Slotted and immutable: large diffs hold one of these per line, and
+    dropping the per-instance ``__dict__`` keeps them small.
+    """
 
     tag: str  # "equal", "insert", "delete", "replace"
     old_line: str | None = None
@@ -25,21 +271,41 @@ class DiffResult:
     similarity_ratio: float = 0.0
     semantic_similarity: float | None = None
     stats: dict[str, int] = field(default_factory=dict)
+    # One byte per entry in ``lines`` (TAG_EQUAL / TAG_DELETE / TAG_INSERT),
+    # filled in by ``PromptDiff`` so whole-diff checks run in C.
+    tags: bytearray = field(default_factory=bytearray, repr=False, compare=False)
 
     @property
     def has_changes(self) -> bool:
+        """True if any line was inserted or deleted."""
+        if self.tags:
+            return self.tags.count(TAG_EQUAL) != len(self.tags)
         return any(line.tag != "equal" for line in self.lines)
 
 
 class PromptDiff:
     """Compute text diffs and semantic similarity between prompt versions."""
 
+    def __init__(self) -> None:
+        """Create a differ with empty embedding and diff caches.
+
+        A differ may be shared between threads; its caches are guarded by a lock.
+        """
+        self._cache_lock = threading.Lock()
+        # (model, sha256 of text) -> unit-normalized float32 embedding vector
+        self._embedding_cache: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        # (old_text, new_text, use_embeddings, fast) -> version-independent result
+        self._full_diff_cache: OrderedDict[tuple[str, str, bool, bool], DiffResult] = (
+            OrderedDict()
+        )
+
     def text_diff(
         self,
         old_text: str,
         new_text: str,
         old_version: int = 0,
         new_version: int = 0,
+        fast: bool = False,
     ) -> DiffResult:
         """Compute a line-level text diff between two prompt strings.
 
@@ -52,54 +318,136 @@ class PromptDiff:
             new_text: The updated prompt text.
             old_version: Version label for the original (used in the result).
             new_version: Version label for the update (used in the result).
+            fast: Use Myers' O(ND) algorithm (see :meth:`_myers_diff`) instead
+                of ``SequenceMatcher``.  Much faster for nearly identical
+                texts; the similarity ratio is then ``1 - D / (N + M)``.
+
+        Lines shared at the start and end of both texts are matched up front,
+        so the diff algorithm only sees the region that actually changed.
 
         Returns:
             A ``DiffResult`` with per-line changes, similarity ratio, and stats.
         """
-        old_lines = old_text.splitlines(keepends=True)
-        new_lines = new_text.splitlines(keepends=True)
+        return self.text_diff_lines(
+            _split_lines(old_text), _split_lines(new_text), old_version, new_version, fast=fast
+        )
+
+    def text_diff_lines(
+        self,
+        old_lines: Sequence[str],
+        new_lines: Sequence[str],
+        old_version: int = 0,
+        new_version: int = 0,
+        fast: bool = False,
+    ) -> DiffResult:
+        """Like :meth:`text_diff`, but for texts that are already split into lines.
 
-        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
-        ratio = matcher.ratio()
+        Lines should keep their line endings (``splitlines(keepends=True)``).
+        Use this when the same version takes part in several diffs, so it is
+        only split once.
+        """
+        n, m = len(old_lines), len(new_lines)
+        prefix, suffix = _common_affixes(old_lines, new_lines)
+        old_mid = old_lines[prefix : n - suffix]
+        new_mid = new_lines[prefix : m - suffix]
+
+        # Only the changed middle is handed to the diff algorithm.
+        opcodes: list[tuple[str, int, int, int, int]] = []
+        if prefix:
+            opcodes.append(("equal", 0, prefix, 0, prefix))
+        if old_mid or new_mid:
+            if fast:
+                mid_opcodes, distance = self._myers_diff(old_mid, new_mid)
+                matched = (n + m - distance) // 2
+            else:
+                matcher = difflib.SequenceMatcher(None, old_mid, new_mid)
+                mid_opcodes = matcher.get_opcodes()
+                matched = prefix + suffix + sum(b.size for b in matcher.get_matching_blocks())
+            opcodes.extend(
+                (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+                for tag, i1, i2, j1, j2 in mid_opcodes
+            )
+        else:
+            matched = prefix + suffix
+        if suffix:
+            opcodes.append(("equal", n - suffix, n, m - suffix, m))
+        ratio = 2.0 * matched / (n + m) if n + m else 1.0
 
         diff_lines: list[DiffLine] = []
-        additions = 0
-        deletions = 0
+        tags = bytearray()
         modifications = 0
 
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        for tag, i1, i2, j1, j2 in opcodes:
             if tag == "equal":
-                for line in old_lines[i1:i2]:
-                    diff_lines.append(DiffLine(tag="equal", old_line=line, new_line=line))
-            elif tag == "delete":
-                for line in old_lines[i1:i2]:
-                    diff_lines.append(DiffLine(tag="delete", old_line=line))
-                    deletions += 1
-            elif tag == "insert":
-                for line in new_lines[j1:j2]:
-                    diff_lines.append(DiffLine(tag="insert", new_line=line))
-                    additions += 1
-            elif tag == "replace":
-                for line in old_lines[i1:i2]:
-                    diff_lines.append(DiffLine(tag="delete", old_line=line))
-                    deletions += 1
-                for line in new_lines[j1:j2]:
-                    diff_lines.append(DiffLine(tag="insert", new_line=line))
-                    additions += 1
+                diff_lines.extend(
+                    DiffLine(tag="equal", old_line=line, new_line=line) for line in old_lines[i1:i2]
+                )
+                tags += TAG_EQUAL * (i2 - i1)
+                continue
+            if tag == "replace":
                 modifications += 1
+            if tag != "insert":
+                diff_lines.extend(DiffLine(tag="delete", old_line=line) for line in old_lines[i1:i2])
+                tags += TAG_DELETE * (i2 - i1)
+            if tag != "delete":
+                diff_lines.extend(DiffLine(tag="insert", new_line=line) for line in new_lines[j1:j2])
+                tags += TAG_INSERT * (j2 - j1)
 
         return DiffResult(
             old_version=old_version,
             new_version=new_version,
             lines=diff_lines,
+            tags=tags,
             similarity_ratio=ratio,
             stats={
-                "additions": additions,
-                "deletions": deletions,
+                "additions": tags.count(TAG_INSERT),
+                "deletions": tags.count(TAG_DELETE),
                 "modifications": modifications,
             },
         )
 
+    @staticmethod
+    def _myers_diff(
+        old_lines: Sequence[str], new_lines: Sequence[str]
+    ) -> tuple[list[tuple[str, int, int, int, int]], int]:
+        """Diff two line sequences with Myers' O(ND) algorithm.
+
+        Runtime grows with the edit distance D rather than with the product of
+        the lengths, which makes it ideal for successive prompt versions that
+        differ in a handful of lines.
+
+        Returns:
+            ``(opcodes, distance)`` where *opcodes* matches the format of
+            ``SequenceMatcher.get_opcodes()`` and *distance* is the number of
+            inserted plus deleted lines.
+
+        With the optional ``numba`` dependency (``pip install
+        llm-promptdiff[fast]``), inputs of at least ``JIT_MIN_LINES`` lines are
+        encoded as integer ids and each step runs as compiled code.
+        """
+        n, m = len(old_lines), len(new_lines)
+        offset = n + m + 1
+        step = _myers_step
+        a: Any = old_lines
+        b: Any = new_lines
+        v: Any = [0] * (2 * offset + 1)
+        jitted = _jitted_myers_step() if n + m >= JIT_MIN_LINES else None
+        if jitted is not None:
+            import numpy as np
+
+            step = jitted
+            a, b = _encode_lines(old_lines, new_lines)
+            v = np.zeros(2 * offset + 1, dtype=np.int64)
+
+        trace: list[Any] = []
+        for d in range(n + m + 1):
+            # Slicing a list copies it, but slicing an array is a view.
+            snap = v[offset - d - 1 : offset + d + 2]
+            trace.append(snap if jitted is None else snap.copy())
+            if step(a, b, v, offset, d):
+                break
+        return _myers_backtrack(trace, n, m), len(trace) - 1
+
     def semantic_similarity(self, text_a: str, text_b: str) -> float:
         """Compute similarity via Jaccard word overlap (no external API needed).
 
@@ -110,17 +458,7 @@ class PromptDiff:
         For true semantic comparison, install ``promptdiff[embeddings]``
         and use :meth:`embedding_similarity`.
         """
-        words_a = set(text_a.lower().split())
-        words_b = set(text_b.lower().split())
-
-        if not words_a and not words_b:
-            return 1.0
-        if not words_a or not words_b:
-            return 0.0
-
-        intersection = words_a & words_b
-        union = words_a | words_b
-        return len(intersection) / len(union)
+        return _jaccard(text_a, text_b)
 
     def embedding_similarity(
         self,
@@ -131,6 +469,8 @@ class PromptDiff:
         """Compute semantic similarity via OpenAI embedding cosine distance.
 
         Requires the ``embeddings`` extra: ``pip install llm-promptdiff[embeddings]``.
+        Embeddings are cached per instance, so comparing a text that was
+        already embedded does not hit the API again.
 
         Args:
             text_a: First text to compare.
@@ -140,6 +480,48 @@ class PromptDiff:
         Returns:
             Cosine similarity in the range [-1, 1] (typically 0 to 1 for text).
 
+        Raises:
+            ImportError: If ``openai`` or ``numpy`` are not installed.
+        """
+        vec_a, vec_b = self._embed([text_a, text_b], model)
+        cosine = float(vec_a @ vec_b)
+        return max(-1.0, min(1.0, cosine))
+
+    def batch_embedding_similarity(
+        self,
+        pairs: list[tuple[str, str]],
+        model: str = "text-embedding-3-small",
+    ) -> list[float]:
+        """Compute embedding cosine similarity for many text pairs at once.
+
+        Every distinct text across *pairs* is embedded in a single API request
+        (texts already in the cache are skipped), which is much cheaper than
+        calling :meth:`embedding_similarity` once per pair.
+
+        Args:
+            pairs: ``(text_a, text_b)`` tuples to compare.
+            model: OpenAI embedding model name.
+
+        Returns:
+            One cosine similarity per pair, in the same order as *pairs*.
+
+        Raises:
+            ImportError: If ``openai`` or ``numpy`` are not installed.
+        """
+        if not pairs:
+            return []
+        unique = list(dict.fromkeys(text for pair in pairs for text in pair))
+        vectors = dict(zip(unique, self._embed(unique, model)))
+        return [max(-1.0, min(1.0, float(vectors[a] @ vectors[b]))) for a, b in pairs]
+
+    def _embed(self, texts: list[str], model: str) -> list[Any]:
+        """Return unit-normalized embeddings for *texts*, in order.
+
+        Vectors are cached by ``(model, sha256(text))`` so repeated texts are
+        only sent to the API once.  Cache misses are fetched together, in as
+        few requests as :data:`EMBEDDING_BATCH_SIZE` and
+        :data:`EMBEDDING_BATCH_CHARS` allow.
+
         Raises:
             ImportError: If ``openai`` or ``numpy`` are not installed.
         """
@@ -151,13 +533,28 @@ class PromptDiff:
                 "Install with `pip install promptdiff[embeddings]` for embedding-based similarity"
             )
 
-        client = OpenAI()
-        resp = client.embeddings.create(input=[text_a, text_b], model=model)
-        vec_a = np.array(resp.data[0].embedding)
-        vec_b = np.array(resp.data[1].embedding)
-
-        cosine = float(np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b)))
-        return cosine
+        cache = self._embedding_cache
+        keys = [(model, hashlib.sha256(text.encode()).hexdigest()) for text in texts]
+        with self._cache_lock:
+            known = {key: cache[key] for key in keys if key in cache}
+        missing = {key: text for key, text in zip(keys, texts) if key not in known}
+
+        if missing:
+            client = OpenAI()
+            for batch in _embedding_batches(list(missing.items())):
+                resp = client.embeddings.create(input=[text for _, text in batch], model=model)
+                for (key, _), item in zip(batch, resp.data):
+                    vec = np.asarray(item.embedding, dtype=np.float32)
+                    norm = np.linalg.norm(vec)
+                    known[key] = vec / norm if norm else vec
+
+        with self._cache_lock:
+            for key in keys:
+                cache[key] = known[key]
+                cache.move_to_end(key)
+            while len(cache) > EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
+        return [known[key] for key in keys]
 
     def full_diff(
         self,
@@ -166,10 +563,12 @@ class PromptDiff:
         old_version: int = 0,
         new_version: int = 0,
         use_embeddings: bool = False,
+        fast: bool = False,
     ) -> DiffResult:
         """Compute a complete diff: line-level changes plus semantic similarity.
 
-        Combines :meth:`text_diff` and :meth:`semantic_similarity` into a single
+        Combines :meth:`text_diff` and :meth:`semantic_similarity` (or
+        :meth:`embedding_similarity` when *use_embeddings* is set) into a single
         ``DiffResult``.
 
         Args:
@@ -177,25 +576,102 @@ class PromptDiff:
             new_text: The updated prompt text.
             old_version: Version label for the original.
             new_version: Version label for the update.
-            use_embeddings: Reserved for future use (embedding support).
+            use_embeddings: Score semantic similarity with OpenAI embeddings
+                instead of Jaccard word overlap.
+            fast: Use Myers' O(ND) line diff (see :meth:`text_diff`).
+
+        Results are memoized by content (the last ``FULL_DIFF_CACHE_SIZE``
+        distinct comparisons), so diffing the same pair again is nearly free.
+        Each call still returns its own ``DiffResult``.
 
         Returns:
             A ``DiffResult`` with lines, similarity_ratio, semantic_similarity, and stats.
         """
-        result = self.text_diff(old_text, new_text, old_version, new_version)
-        result.semantic_similarity = self.semantic_similarity(old_text, new_text)
-        return result
+        cache = self._full_diff_cache
+        key = (old_text, new_text, use_embeddings, fast)
+        with self._cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+        if cached is None:
+            cached = self.text_diff(old_text, new_text, fast=fast)
+            if use_embeddings:
+                cached.semantic_similarity = self.embedding_similarity(old_text, new_text)
+            else:
+                cached.semantic_similarity = self.semantic_similarity(old_text, new_text)
+            with self._cache_lock:
+                cache[key] = cached
+                if len(cache) > FULL_DIFF_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return replace(
+            cached,
+            old_version=old_version,
+            new_version=new_version,
+            lines=list(cached.lines),
+            stats=dict(cached.stats),
+            tags=bytearray(cached.tags),
+        )
 
     def unified_diff(self, old_text: str, new_text: str, old_label: str = "old", new_label: str = "new") -> str:
         """Return a unified diff string (the format used by ``diff -u``).
 
-        Returns an empty string when the texts are identical.
+        Returns an empty string when the texts are identical.  If you already
+        have a ``DiffResult`` for the two texts, :meth:`unified_diff_from_result`
+        renders it without diffing again.
         """
-        return "".join(
-            difflib.unified_diff(
-                old_text.splitlines(keepends=True),
-                new_text.splitlines(keepends=True),
-                fromfile=old_label,
-                tofile=new_label,
-            )
+        return self.unified_diff_from_result(
+            self.text_diff(old_text, new_text), old_label=old_label, new_label=new_label
         )
+
+    def unified_diff_from_result(
+        self,
+        result: DiffResult,
+        old_label: str = "old",
+        new_label: str = "new",
+        context: int = 3,
+    ) -> str:
+        """Render an existing ``DiffResult`` as a unified diff string.
+
+        Produces the same layout as ``difflib.unified_diff``: ``---``/``+++``
+        headers, then ``@@`` hunks with *context* unchanged lines around each
+        change.  Returns an empty string when the result has no changes.
+        """
+        old_lines: list[str] = []
+        new_lines: list[str] = []
+        opcodes: list[tuple[str, int, int, int, int]] = []
+        for line in result.lines:
+            if line.tag == "equal":
+                old_lines.append(line.old_line or "")
+                new_lines.append(line.new_line if line.new_line is not None else line.old_line or "")
+                kind = "equal"
+            elif line.tag == "delete":
+                old_lines.append(line.old_line or "")
+                kind = "change"
+            else:
+                new_lines.append(line.new_line or "")
+                kind = "change"
+            if opcodes and (opcodes[-1][0] == "equal") == (kind == "equal"):
+                tag, i1, _, j1, _ = opcodes[-1]
+                opcodes[-1] = (tag, i1, len(old_lines), j1, len(new_lines))
+            else:
+                i1 = len(old_lines) - (line.tag != "insert")
+                j1 = len(new_lines) - (line.tag != "delete")
+                opcodes.append((kind, i1, len(old_lines), j1, len(new_lines)))
+
+        out: list[str] = []
+        for group in _grouped_opcodes(opcodes, context):
+            if not out:
+                out.append(f"--- {old_label}\n")
+                out.append(f"+++ {new_label}\n")
+            first, last = group[0], group[-1]
+            old_range = _format_unified_range(first[1], last[2])
+            new_range = _format_unified_range(first[3], last[4])
+            out.append(f"@@ -{old_range} +{new_range} @@\n")
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    out.extend(" " + line for line in old_lines[i1:i2])
+                    continue
+                out.extend("-" + line for line in old_lines[i1:i2])
+                out.extend("+" + line for line in new_lines[j1:j2])
+        return "".join(out)
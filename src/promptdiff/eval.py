@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable, Protocol
 
+from promptdiff.diff import _jaccard
+
 
 class Scorer(Protocol):
-    """Protocol for scoring a prompt output against expected output."""
+    """Protocol for scoring a prompt output against expected output.
+
+    Scorers are always called from the thread that runs
+    :meth:`PromptEvaluator.evaluate`, so they need not be thread-safe.
+    """
 
     def __call__(self, output: str, expected: str) -> float: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptTestCase:
     """A single test case for prompt evaluation."""
     __test__ = False  # Prevent pytest collection
@@ -73,13 +80,7 @@ def contains_scorer(output: str, expected: str) -> float:
 
 def similarity_scorer(output: str, expected: str) -> float:
     """Score based on word overlap (Jaccard similarity)."""
-    words_out = set(output.lower().split())
-    words_exp = set(expected.lower().split())
-    if not words_out and not words_exp:
-        return 1.0
-    if not words_out or not words_exp:
-        return 0.0
-    return len(words_out & words_exp) / len(words_out | words_exp)
+    return _jaccard(output, expected)
 
 
 class PromptEvaluator:
@@ -87,15 +88,21 @@ class PromptEvaluator:
 
     The `runner` function takes a prompt template string and input variables,
     then returns the output string. This allows plugging in any LLM backend.
+
+    With ``max_workers > 1``, a custom runner is called concurrently from a
+    thread pool (one call per test case), which speeds up network-bound LLM
+    runners considerably. The runner must be thread-safe in that case.
     """
 
     def __init__(
         self,
         runner: Callable[[str, dict[str, str]], str] | None = None,
         scorer: Scorer | None = None,
+        max_workers: int = 1,
     ) -> None:
         self.runner = runner or self._default_runner
         self.scorer = scorer or similarity_scorer
+        self.max_workers = max_workers
 
     @staticmethod
     def _default_runner(template: str, variables: dict[str, str]) -> str:
@@ -125,8 +132,8 @@ class PromptEvaluator:
         """
         result = EvalResult(prompt_name=prompt_name, version=version)
 
-        for tc in test_cases:
-            output = self.runner(content, tc.input_vars)
+        outputs = self._run_all(content, test_cases)
+        for tc, output in zip(test_cases, outputs):
             score = self.scorer(output, tc.expected)
 
             result.scores.append(score)
@@ -142,6 +149,21 @@ class PromptEvaluator:
 
         return result
 
+    def _run_all(self, content: str, test_cases: list[TestCase]) -> list[str]:
+        """Run every test case through the runner, preserving order.
+
+        The built-in runner is pure string formatting, so it always runs
+        inline where thread start-up would cost more than it saves.
+        """
+        if (
+            self.max_workers > 1
+            and len(test_cases) > 1
+            and self.runner is not self._default_runner
+        ):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                return list(pool.map(lambda tc: self.runner(content, tc.input_vars), test_cases))
+        return [self.runner(content, tc.input_vars) for tc in test_cases]
+
     def compare(
         self,
         results: list[EvalResult],
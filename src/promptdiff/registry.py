@@ -42,13 +42,12 @@ class PromptRegistry:
     def set_tags(self, name: str, tags: list[str]) -> None:
         """Set tags for a prompt."""
         meta = self.store._read_meta(name)
-        meta["tags"] = sorted(set(tags))
-        self.store._write_meta(name, meta)
+        self.store._write_meta(name, {**meta, "tags": sorted(set(tags))})
 
     def get_tags(self, name: str) -> list[str]:
         """Get tags for a prompt."""
         meta = self.store._read_meta(name)
-        return meta.get("tags", [])
+        return list(meta.get("tags", []))
 
     def add_tags(self, name: str, tags: list[str]) -> None:
         """Merge *tags* into the prompt's existing tag set (duplicates are removed)."""
@@ -57,21 +56,17 @@ class PromptRegistry:
 
     def find_by_tag(self, tag: str) -> list[str]:
         """Return a list of prompt names that have the given *tag*."""
-        results = []
-        for name in self.store.list_prompts():
-            if tag in self.get_tags(name):
-                results.append(name)
-        return results
+        metas = self.store.batch_read_meta()
+        return [name for name, meta in metas.items() if tag in meta.get("tags", [])]
 
     def list_all(self) -> list[dict[str, Any]]:
         """Return summary dicts for every prompt (name, latest_version, tags, total_versions)."""
-        results = []
-        for name in self.store.list_prompts():
-            meta = self.store._read_meta(name)
-            results.append({
+        return [
+            {
                 "name": name,
                 "latest_version": meta.get("latest_version", 0),
                 "tags": meta.get("tags", []),
-                "total_versions": len(meta.get("versions", [])),
-            })
-        return results
+                "total_versions": meta.get("latest_version", 0),
+            }
+            for name, meta in self.store.batch_read_meta().items()
+        ]
@@ -2,16 +2,184 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
+import mmap
+import os
 import shutil
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - exercised when blake3 is not installed
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - exercised when xxhash is not installed
+    xxhash = None  # type: ignore[assignment]
+
 STORE_DIR = ".promptdiff"
 PROMPTS_DIR = "prompts"
 META_FILE = "promptdiff.json"
+VERSIONS_FILE = "versions.jsonl"
+OBJECTS_DIR = "objects"
+# Below this many files, reading them one by one beats starting a thread pool.
+PARALLEL_READ_MIN = 32
+PARALLEL_READ_WORKERS = 16
+# Version reads go through a per-thread buffer of at least this size; files
+# larger than READ_BUFFER_MAX get a one-off buffer so none is kept around.
+READ_BUFFER_SIZE = 64 * 1024
+READ_BUFFER_MAX = 1024 * 1024
+
+_read_buffers = threading.local()
+
+ZSTD_LEVEL = 3
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from *data*, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize *obj* as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _json_line(obj: Any) -> bytes:
+    """Serialize *obj* as one compact line of JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _file_stamp(st: os.stat_result) -> tuple[int, int, int]:
+    """Return the ``(mtime_ns, size, inode)`` used to validate cached file parses.
+
+    Atomic rewrites replace the file, so the inode changes even when an edit
+    keeps the size and lands within one mtime tick.
+    """
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _atomic_write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Replace *path* with *data* so readers never observe a partial file.
+
+    With *fsync*, the data reaches the disk before the rename publishes it.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _require_zstandard() -> Any:
+    """Import ``zstandard`` on first use; only compressed stores need it."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Install with `pip install llm-promptdiff[compress]` for zstd-compressed stores"
+        ) from None
+    return zstandard
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return _require_zstandard().ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return _require_zstandard().ZstdDecompressor().decompress(data)
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 version file through a reusable per-thread buffer.
+
+    The bytes land in a buffer that is kept between calls and are decoded
+    straight from it, so reading a file allocates only the resulting string.
+    ``.zst`` files are decompressed first.  Line endings are normalized like
+    :meth:`Path.read_text` does.
+    """
+    if path.suffix == ".zst":
+        text = _zstd_decompress(path.read_bytes()).decode("utf-8")
+    else:
+        text = _read_buffered(path)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_buffered(path: Path) -> str:
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf: bytearray | None = getattr(_read_buffers, "buf", None)
+        if size > READ_BUFFER_MAX:
+            buf = bytearray(size)
+        elif buf is None or size > len(buf):
+            buf = _read_buffers.buf = bytearray(max(size, READ_BUFFER_SIZE))
+        with memoryview(buf) as view:
+            n = 0
+            while n < size:
+                got = f.readinto(view[n:size])
+                if not got:
+                    break
+                n += got
+            return str(view[:n], "utf-8")
+
+
+def _read_texts(paths: list[Path]) -> list[str]:
+    """Read many small text files, in order, overlapping the I/O on a thread pool.
+
+    File reads release the GIL, so for long version histories the open/read
+    round trips run concurrently instead of back to back.
+    """
+    if len(paths) < PARALLEL_READ_MIN:
+        return [_read_text(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=PARALLEL_READ_WORKERS) as pool:
+        return list(pool.map(_read_text, paths))
+
+
+def _fsync_path(path: Path) -> None:
+    """fsync a file or directory.
+
+    Directories cannot be opened on Windows; there the rename is already
+    durable once the file data is, so they are skipped.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (IsADirectoryError, PermissionError):
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def _now_iso() -> str:
@@ -19,30 +187,149 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _content_hash(text: str) -> str:
-    """Return a truncated SHA-256 hex digest (12 chars) of the given text."""
-    return hashlib.sha256(text.encode()).hexdigest()[:12]
+# Content hash algorithms by the id recorded in each prompt's meta.json.
+_HASH_FACTORIES: dict[str, Callable[[], Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": partial(hashlib.blake2b, digest_size=32),
+}
+if blake3 is not None:
+    _HASH_FACTORIES["blake3"] = blake3.blake3
+if xxhash is not None:
+    _HASH_FACTORIES["xxh3_128"] = xxhash.xxh3_128
+
+# The content hash only identifies content (it is never used for
+# authentication), so new stores default to the fastest installed algorithm.
+FAST_HASH_ALGO = next(a for a in ("blake3", "xxh3_128", "blake2b") if a in _HASH_FACTORIES)
+# Algorithm of stores whose promptdiff.json predates the ``hash_algo`` pin.
+UNPINNED_HASH_ALGO = "sha256"
+# Algorithm of prompts whose meta.json predates the ``hash_algo`` field.
+LEGACY_HASH_ALGO = "blake2b"
+# A digest match is trusted as equal content only for these; with the others
+# (xxHash3) a crafted collision is feasible, so the bytes are compared too.
+COLLISION_RESISTANT_HASHES = frozenset({"sha256", "blake2b", "blake3"})
+
+
+def _hasher(algo: str = FAST_HASH_ALGO) -> Any:
+    """Return a fresh hash object for content hashing with *algo*."""
+    return _HASH_FACTORIES[algo]()
+
+
+def _content_digest_bytes(data: bytes, algo: str = FAST_HASH_ALGO) -> str:
+    """Return the full content digest (hex) of already-encoded *data*.
+
+    The full digest names content blobs; version metadata records the
+    truncated form returned by :func:`_content_hash_bytes`.
+    """
+    h = _hasher(algo)
+    h.update(data)
+    return h.hexdigest()
+
+
+def _content_hash_bytes(data: bytes, algo: str = FAST_HASH_ALGO) -> str:
+    """Return the truncated content hash (12 hex chars) of already-encoded *data*.
+
+    Callers that already hold the UTF-8 bytes use this to skip a re-encode.
+    """
+    return _content_digest_bytes(data, algo)[:12]
+
+
+def _content_hash(text: str, algo: str = FAST_HASH_ALGO) -> str:
+    """Return the truncated content hash (12 hex chars) of the given text.
+
+    Hashes stored by older versions (truncated SHA-256 or BLAKE2b) remain
+    valid as opaque identifiers.
+    """
+    return _content_hash_bytes(text.encode("utf-8"), algo)
+
+
+def _file_equals(path: Path, data: bytes) -> bool:
+    """Return True if the file at *path* holds exactly *data*.
+
+    The file is memory-mapped and compared in place: no Python string or
+    bytes copy is built, the size check is free, and the comparison stops at
+    the first differing byte.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size != len(data):
+            return False
+        if not size:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return view == data
+
+
+@dataclass(slots=True)
+class _VersionLog:
+    """Parsed ``versions.jsonl`` of one prompt, indexed by version number."""
+
+    stamp: tuple[int, int, int]
+    entries: list[dict[str, Any]]
+    by_num: dict[int, dict[str, Any]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.by_num = {v["version"]: v for v in self.entries}
+
+    def append(self, entry: dict[str, Any]) -> None:
+        self.entries.append(entry)
+        self.by_num[entry["version"]] = entry
+
+    def committed(self, latest: int) -> list[dict[str, Any]]:
+        """Return the entries up to version *latest*, the last one per number.
+
+        An ``add`` whose ``meta.json`` write failed leaves its entry in the log
+        past ``latest_version``, and a retry appends that version again; both
+        leftovers are skipped here.
+        """
+        entries = self.entries
+        if len(self.by_num) == len(entries) and (not entries or entries[-1]["version"] <= latest):
+            return entries
+        return [v for n, v in sorted(self.by_num.items()) if n <= latest]
 
 
 class VersionInfo:
-    """Metadata for a single prompt version."""
+    """Metadata for a single prompt version.
+
+    When built with a *content_path* and no *content*, the version file is
+    only read the first time :attr:`content` is accessed.
+    """
 
     def __init__(
         self,
         version: int,
-        content: str,
+        content: str | None = None,
         message: str = "",
         timestamp: str = "",
         content_hash: str = "",
         metadata: dict[str, Any] | None = None,
+        content_path: Path | None = None,
     ) -> None:
+        if content is None and content_path is None:
+            content = ""
         self.version = version
-        self.content = content
+        self._content_cache = content
+        self._content_path = content_path
         self.message = message
         self.timestamp = timestamp or _now_iso()
-        self.content_hash = content_hash or _content_hash(content)
+        self.content_hash = content_hash or _content_hash(self.content)
         self.metadata = metadata or {}
 
+    @property
+    def content(self) -> str:
+        """Full text of this version, read from disk on first access if needed."""
+        if self._content_cache is None:
+            self._content_cache = _read_text(self._content_path)  # type: ignore[arg-type]
+        return self._content_cache
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content_cache = value
+
+    @cached_property
+    def date(self) -> str:
+        """Return the ``YYYY-MM-DD`` part of the timestamp, or ``""`` if unset."""
+        return self.timestamp[:10] if self.timestamp else ""
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize version metadata to a dictionary (excludes content)."""
         return {
@@ -54,15 +341,26 @@ class VersionInfo:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any], content: str = "") -> VersionInfo:
-        """Reconstruct a VersionInfo from a metadata dict and optional content string."""
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        content: str | None = None,
+        content_path: Path | None = None,
+    ) -> VersionInfo:
+        """Reconstruct a VersionInfo from a metadata dict and optional content string.
+
+        Pass *content_path* instead of *content* to load the text lazily.
+        The metadata is copied, since *data* may be a cached log entry.
+        """
+        metadata = data.get("metadata")
         return cls(
             version=data["version"],
             content=content,
             message=data.get("message", ""),
             timestamp=data.get("timestamp", ""),
             content_hash=data.get("content_hash", ""),
-            metadata=data.get("metadata", {}),
+            metadata=copy.deepcopy(metadata) if metadata else {},
+            content_path=content_path,
         )
 
 
@@ -72,23 +370,63 @@ class PromptStore:
     Layout:
         .promptdiff/
             promptdiff.json          # global metadata
+            objects/
+                ab/cdef...           # each distinct content once, named by digest
             prompts/
                 my-prompt/
-                    meta.json        # prompt metadata + version list
-                    v1.txt           # version 1 content
-                    v2.txt           # version 2 content
+                    meta.json        # prompt metadata (name, tags, latest version)
+                    versions.jsonl   # append-only version log, one entry per line
+                    v1.txt           # version 1 content (hard link to its object)
+                    v2.txt.zst       # version 2 content, zstd-compressed
+
+    Version files share storage with their object, so they must never be
+    rewritten in place.
     """
 
-    def __init__(self, root: str | Path = ".") -> None:
+    def __init__(
+        self,
+        root: str | Path = ".",
+        durable: bool = False,
+        cryptographic_hash: bool = False,
+        compress: bool = False,
+    ) -> None:
         """Create a PromptStore rooted at the given directory.
 
         Args:
             root: Filesystem path that will contain the ``.promptdiff/`` directory.
                   Defaults to the current working directory.
+            durable: fsync every write (and the directories it touched) so a
+                  completed ``add`` survives a power loss. Use :meth:`batch`
+                  to share one round of fsyncs between many writes.
+            cryptographic_hash: Have :meth:`init` create the store with
+                  SHA-256 instead of the fastest installed algorithm (BLAKE3,
+                  xxHash3 or BLAKE2b). Duplicate detection compares full
+                  digests, so this gives it collision resistance against
+                  crafted input; the short ``content_hash`` of each version is
+                  only an identifier.
+            compress: Store new versions zstd-compressed (requires the
+                  ``compress`` extra). Existing versions are left as they are.
+
+        Raises:
+            ImportError: If *compress* is set and ``zstandard`` is not installed.
         """
+        if compress:
+            _require_zstandard()
         self.root = Path(root).resolve()
+        self.durable = durable
+        self.cryptographic_hash = cryptographic_hash
+        self.compress = compress
+        # Paths written inside batch() whose fsync is deferred to its end.
+        self._unsynced: set[Path] | None = None
         self.store_path = self.root / STORE_DIR
         self.prompts_path = self.store_path / PROMPTS_DIR
+        self.objects_path = self.store_path / OBJECTS_DIR
+        # Parsed meta.json per prompt, keyed by name and validated against the
+        # file's (mtime_ns, size, inode) so edits made outside this instance
+        # are seen.
+        self._meta_cache: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+        # Parsed versions.jsonl per prompt, validated the same way.
+        self._versions_cache: dict[str, _VersionLog] = {}
 
     @property
     def initialized(self) -> bool:
@@ -105,28 +443,281 @@ class PromptStore:
         self.prompts_path.mkdir(exist_ok=True)
         meta_path = self.store_path / META_FILE
         if not meta_path.exists():
-            meta_path.write_text(
-                json.dumps({"created": _now_iso(), "version": "0.1.0"}, indent=2)
-            )
+            config = {
+                "created": _now_iso(),
+                "version": "0.1.0",
+                "hash_algo": "sha256" if self.cryptographic_hash else FAST_HASH_ALGO,
+            }
+            self._atomic_write(meta_path, _json_dumps(config))
+        self.__dict__.pop("hash_algo", None)
         return self.store_path
 
+    @cached_property
+    def hash_algo(self) -> str:
+        """Content hash algorithm of this store, pinned in ``promptdiff.json``.
+
+        :meth:`init` records it when it creates the store, so every version
+        and object is hashed the same way whichever extras are installed.
+
+        Raises:
+            ValueError: If *cryptographic_hash* was requested but the store
+                uses another algorithm.
+            ImportError: If the pinned algorithm is not installed.
+        """
+        try:
+            config = _json_loads((self.store_path / META_FILE).read_bytes())
+        except FileNotFoundError:
+            return "sha256" if self.cryptographic_hash else FAST_HASH_ALGO
+        algo = config.get("hash_algo", UNPINNED_HASH_ALGO)
+        if self.cryptographic_hash and algo != "sha256":
+            raise ValueError(
+                f"This store hashes content with {algo}; cryptographic_hash=True "
+                "needs a store created with it"
+            )
+        if algo not in _HASH_FACTORIES:
+            raise ImportError(
+                f"This store hashes content with {algo}. "
+                "Install with `pip install llm-promptdiff[fast]`"
+            )
+        return algo
+
+    @contextmanager
+    def batch(self) -> Iterator[PromptStore]:
+        """Group writes so a durable store fsyncs each touched path once, at the end.
+
+        Files replaced by an atomic rename (``meta.json``) are still fsynced
+        before the rename, so a crash inside the block may lose any of its
+        writes but never leaves a partially written metadata file.  Has no
+        effect on non-durable stores.
+        """
+        if self._unsynced is not None:
+            yield self
+            return
+        self._unsynced = set()
+        try:
+            yield self
+        finally:
+            unsynced, self._unsynced = self._unsynced, None
+            # Files first, then the directories whose entries point at them.
+            for path in sorted(unsynced, key=Path.is_dir):
+                try:
+                    _fsync_path(path)
+                except FileNotFoundError:
+                    continue
+
+    def _sync(self, path: Path, data_synced: bool = False) -> None:
+        """Make a completed write to *path* durable, if this store is durable."""
+        if not self.durable:
+            return
+        if self._unsynced is not None:
+            self._unsynced.add(path.parent)
+            if not data_synced:
+                self._unsynced.add(path)
+            return
+        if not data_synced:
+            _fsync_path(path)
+        _fsync_path(path.parent)
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        """Atomically replace *path* with *data*, honouring :attr:`durable`.
+
+        The data is fsynced before the rename even inside :meth:`batch`; only
+        the directory fsync is deferred.
+        """
+        _atomic_write_bytes(path, data, fsync=self.durable)
+        self._sync(path, data_synced=self.durable)
+
     def _prompt_dir(self, name: str) -> Path:
         return self.prompts_path / name
 
     def _meta_path(self, name: str) -> Path:
         return self._prompt_dir(name) / "meta.json"
 
-    def _version_path(self, name: str, version: int) -> Path:
-        return self._prompt_dir(name) / f"v{version}.txt"
+    def _versions_path(self, name: str) -> Path:
+        return self._prompt_dir(name) / VERSIONS_FILE
+
+    def _version_path(self, name: str, version: int, compressed: bool = False) -> Path:
+        return self._prompt_dir(name) / (f"v{version}.txt.zst" if compressed else f"v{version}.txt")
+
+    def _entry_path(self, name: str, entry: dict[str, Any]) -> Path:
+        """Return the content file of a version log entry."""
+        return self._version_path(name, entry["version"], entry.get("encoding") == "zstd")
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_path / digest[:2] / digest[2:]
+
+    def _write_content(self, path: Path, data: bytes, digest: str) -> None:
+        """Write a version file, sharing storage with identical earlier content.
+
+        The content is stored once under ``objects/`` and *path* becomes a hard
+        link to it.  New content is written straight to *path*, which is then
+        linked into ``objects/``: the version file is not referenced by the
+        version log yet, so it needs no temporary file and rename, and the
+        object only appears once complete.  Where hard links are not supported
+        the version file is left as a plain copy.  Under a non-cryptographic
+        hash an existing object is only shared after a byte comparison.
+        """
+        blob = self._object_path(digest)
+        path.unlink(missing_ok=True)
+        if self.hash_algo not in COLLISION_RESISTANT_HASHES:
+            try:
+                collision = not _file_equals(blob, data)
+            except FileNotFoundError:
+                collision = False
+            if collision:
+                self._write_new_file(path, data)
+                return
+        try:
+            os.link(blob, path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            self._write_new_file(path, data)
+            return
+        else:
+            self._sync(path, data_synced=True)
+            return
+
+        self._write_new_file(path, data)
+        if not blob.parent.is_dir():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            self._sync(blob.parent)
+        try:
+            os.link(path, blob)
+        except OSError:
+            # Another writer published the same content first, or hard links
+            # are unsupported: either way this version file stays a copy.
+            return
+        self._sync(blob, data_synced=True)
+
+    def _write_new_file(self, path: Path, data: bytes) -> None:
+        fsync = self.durable and self._unsynced is None
+        with open(path, "xb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._sync(path, data_synced=fsync)
+
+    def _collect_garbage(self, digests: set[str]) -> None:
+        """Remove the objects in *digests* that no version file links to anymore."""
+        for digest in digests:
+            blob = self._object_path(digest)
+            try:
+                if blob.stat().st_nlink > 1:
+                    continue
+                blob.unlink()
+            except FileNotFoundError:
+                continue
+            try:
+                blob.parent.rmdir()
+            except OSError:
+                pass
 
     def _read_meta(self, name: str) -> dict[str, Any]:
+        """Return the parsed ``meta.json`` of *name*, reusing a cached parse.
+
+        The cached dict is shared between callers: mutate it only on the way
+        to :meth:`_write_meta`.
+        """
         meta_path = self._meta_path(name)
-        if not meta_path.exists():
-            raise FileNotFoundError(f"Prompt '{name}' not found")
-        return json.loads(meta_path.read_text())
+        try:
+            stamp = _file_stamp(meta_path.stat())
+            cached = self._meta_cache.get(name)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            raw = meta_path.read_bytes()
+        except FileNotFoundError:
+            self._meta_cache.pop(name, None)
+            raise FileNotFoundError(f"Prompt '{name}' not found") from None
+        meta = _json_loads(raw)
+        self._meta_cache[name] = (stamp, meta)
+        return meta
 
     def _write_meta(self, name: str, meta: dict[str, Any]) -> None:
-        self._meta_path(name).write_text(json.dumps(meta, indent=2))
+        meta_path = self._meta_path(name)
+        self._meta_cache.pop(name, None)
+        self._atomic_write(meta_path, _json_dumps(meta))
+        self._meta_cache[name] = (_file_stamp(meta_path.stat()), meta)
+
+    def _read_versions(self, name: str, meta: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the version entries of *name* in chronological order.
+
+        Stores written before the version log existed keep the list inline in
+        ``meta.json``; it is used as long as it is there.
+        """
+        if "versions" in meta:
+            return meta["versions"]
+        return self._load_version_log(name).committed(meta["latest_version"])
+
+    def _version_index(self, name: str, meta: dict[str, Any]) -> dict[int, dict[str, Any]]:
+        """Return the version entries of *name* keyed by version number.
+
+        Entries past ``meta["latest_version"]`` may be present; callers look up
+        version numbers they got from *meta*.
+        """
+        if "versions" in meta:
+            return {v["version"]: v for v in meta["versions"]}
+        return self._load_version_log(name).by_num
+
+    def _load_version_log(self, name: str) -> _VersionLog:
+        path = self._versions_path(name)
+        try:
+            stamp = _file_stamp(path.stat())
+            cached = self._versions_cache.get(name)
+            if cached is not None and cached.stamp == stamp:
+                return cached
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            self._versions_cache.pop(name, None)
+            return _VersionLog((0, 0, 0), [])
+        entries = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(_json_loads(line))
+            except ValueError:
+                # A crash mid-append leaves a torn line (later appends start
+                # after it); its add never updated meta.json, so it is dropped.
+                continue
+        log = _VersionLog(stamp, entries)
+        self._versions_cache[name] = log
+        return log
+
+    def _append_version(self, name: str, entry: dict[str, Any]) -> None:
+        """Append one entry to the version log without rewriting earlier ones."""
+        path = self._versions_path(name)
+        cached = self._versions_cache.pop(name, None)
+        line = _json_line(entry)
+        with open(path, "a+b") as f:
+            before = os.fstat(f.fileno())
+            if before.st_size:
+                # Start a fresh line after a torn one left by a crash.
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(line)
+            f.flush()
+            after = _file_stamp(os.fstat(f.fileno()))
+        self._sync(path)
+        # Cache the entry as a later parse would see it (e.g. with string keys).
+        entry = _json_loads(line)
+        if before.st_size == 0:
+            self._versions_cache[name] = _VersionLog(after, [entry])
+        elif cached is not None and cached.stamp == _file_stamp(before):
+            cached.append(entry)
+            cached.stamp = after
+            self._versions_cache[name] = cached
+
+    def _migrate_versions(self, name: str, versions: list[dict[str, Any]]) -> None:
+        """Move a legacy inline version list out of ``meta.json`` into the log.
+
+        The caller writes ``meta.json`` without the list afterwards; until it
+        does, the inline list stays authoritative.
+        """
+        self._atomic_write(self._versions_path(name), b"".join(map(_json_line, versions)))
+        self._versions_cache.pop(name, None)
 
     def add(
         self,
@@ -152,38 +743,90 @@ class PromptStore:
         """
         self._ensure_init()
         prompt_dir = self._prompt_dir(name)
-        prompt_dir.mkdir(parents=True, exist_ok=True)
 
-        meta_path = self._meta_path(name)
-        if meta_path.exists():
-            meta = json.loads(meta_path.read_text())
-            # Check for duplicate content
+        # Encode once: the same bytes are hashed and written.
+        data = content.encode("utf-8")
+        digest = _content_digest_bytes(data, self.hash_algo)
+        new_hash = digest[:12]
+        try:
+            meta: dict[str, Any] | None = dict(self._read_meta(name))
+        except FileNotFoundError:
+            meta = None
+        if meta is not None:
+            # meta.json is the prompt's small head: together with the parse
+            # cache, appending never reads or parses the version log.
+            # Check for duplicate content.  When meta.json holds the latest
+            # full digest in this store's algorithm, no version file is read
+            # unless the digests match under a non-cryptographic hash;
+            # otherwise compare the latest file's bytes with the new content.
             latest_v = meta["latest_version"]
-            latest_content = self._version_path(name, latest_v).read_text()
-            if latest_content == content:
-                return self.get_version(name, latest_v)
+            latest_digest = meta.get("latest_digest")
+            if (
+                latest_digest is not None
+                and meta.get("hash_algo", LEGACY_HASH_ALGO) == self.hash_algo
+            ):
+                duplicate = latest_digest == digest and (
+                    self.hash_algo in COLLISION_RESISTANT_HASHES
+                    or self._latest_equals(name, meta, data)
+                )
+            else:
+                duplicate = self._latest_equals(name, meta, data)
+            if duplicate:
+                return self._version_from_meta(name, meta, latest_v)
             next_version = latest_v + 1
         else:
-            meta = {"name": name, "created": _now_iso(), "tags": [], "versions": []}
+            meta = {"name": name, "created": _now_iso(), "tags": []}
             next_version = 1
+            prompt_dir.mkdir(parents=True, exist_ok=True)
+            self._sync(prompt_dir)
+        if "versions" in meta:
+            self._migrate_versions(name, meta.pop("versions"))
 
         info = VersionInfo(
             version=next_version,
             content=content,
             message=message,
+            content_hash=new_hash,
             metadata=metadata,
         )
 
         # Write content
-        self._version_path(name, next_version).write_text(content)
+        entry = info.to_dict()
+        if self.compress:
+            object_id = digest + ".zst"
+            self._write_content(
+                self._version_path(name, next_version, compressed=True),
+                _zstd_compress(data),
+                object_id,
+            )
+            entry["encoding"] = "zstd"
+        else:
+            object_id = digest
+            self._write_content(self._version_path(name, next_version), data, object_id)
 
-        # Update metadata
+        # Append to the version log, then update the small metadata head
+        entry["object"] = object_id
+        self._append_version(name, entry)
         meta["latest_version"] = next_version
-        meta["versions"].append(info.to_dict())
+        meta["latest_digest"] = digest
+        meta["hash_algo"] = self.hash_algo
         self._write_meta(name, meta)
 
         return info
 
+    def _latest_equals(self, name: str, meta: dict[str, Any], data: bytes) -> bool:
+        """Return True if the latest version of *name* holds exactly *data*."""
+        latest_v = meta["latest_version"]
+        latest_entry = self._version_index(name, meta).get(latest_v)
+        latest_path = (
+            self._entry_path(name, latest_entry)
+            if latest_entry is not None
+            else self._version_path(name, latest_v)
+        )
+        if latest_path.suffix == ".zst":
+            return _zstd_decompress(latest_path.read_bytes()) == data
+        return _file_equals(latest_path, data)
+
     def get_version(self, name: str, version: int | None = None) -> VersionInfo:
         """Retrieve a specific version of a prompt, or the latest if *version* is None.
 
@@ -196,44 +839,118 @@ class PromptStore:
 
         if version is None:
             version = meta["latest_version"]
+        return self._version_from_meta(name, meta, version)
 
-        version_path = self._version_path(name, version)
-        if not version_path.exists():
-            raise FileNotFoundError(f"Version {version} of '{name}' not found")
+    def _version_from_meta(
+        self,
+        name: str,
+        meta: dict[str, Any],
+        version: int,
+        content: str | None = None,
+    ) -> VersionInfo:
+        """Build a ``VersionInfo`` from already-parsed prompt metadata.
 
-        content = version_path.read_text()
-        version_data = next((v for v in meta["versions"] if v["version"] == version), None)
+        Lets callers that hold ``meta`` (and possibly the content) avoid a
+        second metadata parse.  Without *content*, the version file is only
+        checked for existence here and read when the content is first used.
+        """
+        if version > meta["latest_version"]:
+            raise FileNotFoundError(f"Version {version} of '{name}' not found")
+        version_data = self._version_index(name, meta).get(version)
+        path = (
+            self._entry_path(name, version_data)
+            if version_data is not None
+            else self._version_path(name, version)
+        )
+        if content is None and not path.is_file():
+            raise FileNotFoundError(f"Version {version} of '{name}' not found")
         if version_data is None:
             raise ValueError(f"Version {version} metadata missing for '{name}'")
 
-        return VersionInfo.from_dict(version_data, content=content)
+        return VersionInfo.from_dict(version_data, content=content, content_path=path)
 
-    def list_versions(self, name: str) -> list[VersionInfo]:
+    def list_versions(self, name: str, preload: bool = False) -> list[VersionInfo]:
         """Return all versions of a prompt in chronological order.
 
+        Version contents are read lazily, on first access of ``content``.
+
+        Args:
+            name: Prompt identifier.
+            preload: Read every version's content up front, in one batch.
+                Worth it when the caller will use all of them.
+
         Raises:
             FileNotFoundError: If the prompt does not exist.
         """
         self._ensure_init()
         meta = self._read_meta(name)
-        results = []
-        for v_data in meta["versions"]:
-            content = self._version_path(name, v_data["version"]).read_text()
-            results.append(VersionInfo.from_dict(v_data, content=content))
-        return results
+        entries = self._read_versions(name, meta)
+        paths = [self._entry_path(name, v) for v in entries]
+        if not preload:
+            return [
+                VersionInfo.from_dict(v_data, content_path=path)
+                for v_data, path in zip(entries, paths)
+            ]
+        return [
+            VersionInfo.from_dict(v_data, content=content)
+            for v_data, content in zip(entries, _read_texts(paths))
+        ]
+
+    def batch_read_meta(self, names: list[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Read the metadata of many prompts in one pass.
+
+        With *names* omitted, the prompts directory is scanned once and every
+        prompt that has a ``meta.json`` is included.  This avoids the per-prompt
+        existence checks of calling :meth:`list_prompts` and then reading each
+        prompt's metadata separately.
+
+        Args:
+            names: Prompts to read. Defaults to every prompt in the store.
+
+        Returns:
+            A dict mapping prompt name to a copy of its metadata, ordered by
+            name when scanning, otherwise in the order of *names*.
+
+        Raises:
+            FileNotFoundError: If one of the explicitly requested prompts does not exist.
+        """
+        self._ensure_init()
+        if names is not None:
+            return {name: copy.deepcopy(self._read_meta(name)) for name in names}
+
+        if not self.prompts_path.exists():
+            return {}
+        with os.scandir(self.prompts_path) as entries:
+            candidates = sorted(e.name for e in entries if e.is_dir())
+        metas: dict[str, dict[str, Any]] = {}
+        for name in candidates:
+            try:
+                metas[name] = copy.deepcopy(self._read_meta(name))
+            except FileNotFoundError:
+                continue
+        return metas
 
     def list_prompts(self) -> list[str]:
         """Return a sorted list of all prompt names in the store."""
         self._ensure_init()
         if not self.prompts_path.exists():
             return []
-        return sorted(
-            d.name for d in self.prompts_path.iterdir() if d.is_dir() and (d / "meta.json").exists()
-        )
+        # DirEntry.is_dir() answers from the directory listing itself, leaving
+        # one stat per prompt for the meta.json check.
+        with os.scandir(self.prompts_path) as entries:
+            names = [
+                e.name
+                for e in entries
+                if e.is_dir() and os.path.exists(os.path.join(e.path, "meta.json"))
+            ]
+        names.sort()
+        return names
 
     def delete_prompt(self, name: str) -> None:
         """Delete a prompt and all its versions permanently.
 
+        Content objects that no other prompt still links to are removed too.
+
         Raises:
             FileNotFoundError: If the prompt does not exist.
         """
@@ -241,7 +958,18 @@ class PromptStore:
         prompt_dir = self._prompt_dir(name)
         if not prompt_dir.exists():
             raise FileNotFoundError(f"Prompt '{name}' not found")
+        try:
+            meta = self._read_meta(name)
+        except FileNotFoundError:
+            entries = []
+        else:
+            # Every logged entry, so objects of uncommitted versions go too.
+            entries = meta.get("versions") or self._load_version_log(name).entries
+        digests = {v["object"] for v in entries if "object" in v}
+        self._meta_cache.pop(name, None)
+        self._versions_cache.pop(name, None)
         shutil.rmtree(prompt_dir)
+        self._collect_garbage(digests)
 
     def _ensure_init(self) -> None:
         """Raise RuntimeError if the store has not been initialized."""
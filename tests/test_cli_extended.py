@@ -141,3 +141,39 @@ class TestCLINotInitialized:
         with runner.isolated_filesystem(temp_dir=tmp_path):
             result = runner.invoke(cli, ["diff", "p", "1", "2"])
             assert result.exit_code != 0
+
+
+class TestCLIImportCost:
+    """The CLI should only import command-specific modules when they are used."""
+
+    def test_cli_import_skips_heavy_modules(self) -> None:
+        import os
+        import subprocess
+        import sys
+
+        src = str(Path(__file__).resolve().parent.parent / "src")
+        pythonpath = os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+        code = (
+            "import sys, promptdiff.cli; "
+            "print(sorted(m for m in ('promptdiff.diff', 'promptdiff.changelog', "
+            "'promptdiff.eval', 'rich.table', 'zstandard') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            env={**os.environ, "PYTHONPATH": pythonpath},
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
+    def test_package_exports_resolve_lazily(self) -> None:
+        import promptdiff
+        from promptdiff.eval import PromptTestCase
+        from promptdiff.store import PromptStore
+
+        assert promptdiff.PromptStore is PromptStore
+        assert promptdiff.TestCase is PromptTestCase
+        assert "PromptDiff" in dir(promptdiff)
@@ -64,6 +64,99 @@ class TestEmbeddingSimilarity:
             else:
                 sys.modules.pop("openai", None)
 
+    def test_embedding_similarity_caches_vectors(self) -> None:
+        """Repeated texts should be embedded only once per PromptDiff instance."""
+        import sys
+        import types
+
+        d = PromptDiff()
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = lambda input, model: MagicMock(
+            data=[MagicMock(embedding=[float(len(t)), 1.0]) for t in input]
+        )
+
+        fake_openai = types.ModuleType("openai")
+        fake_openai.OpenAI = MagicMock(return_value=mock_client)  # type: ignore[attr-defined]
+        old_mod = sys.modules.get("openai")
+        sys.modules["openai"] = fake_openai
+        try:
+            first = d.embedding_similarity("hello", "hi")
+            second = d.embedding_similarity("hello", "hi")
+            d.embedding_similarity("hi", "hey there")
+        finally:
+            if old_mod is not None:
+                sys.modules["openai"] = old_mod
+            else:
+                sys.modules.pop("openai", None)
+
+        assert first == second
+        assert mock_client.embeddings.create.call_count == 2
+        last_call = mock_client.embeddings.create.call_args_list[-1]
+        assert last_call.kwargs["input"] == ["hey there"]
+
+    def test_batch_embedding_similarity_single_request(self, tmp_path: Path) -> None:
+        """A changelog over many versions should embed them in one request."""
+        import sys
+        import types
+
+        from promptdiff.changelog import ChangelogGenerator
+
+        store = PromptStore(tmp_path)
+        store.init()
+        for i in range(4):
+            store.add("p", f"version {i}\n" * (i + 1), message=f"v{i + 1}")
+
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = lambda input, model: MagicMock(
+            data=[MagicMock(embedding=[float(len(t)), 1.0]) for t in input]
+        )
+        fake_openai = types.ModuleType("openai")
+        fake_openai.OpenAI = MagicMock(return_value=mock_client)  # type: ignore[attr-defined]
+        old_mod = sys.modules.get("openai")
+        sys.modules["openai"] = fake_openai
+        try:
+            gen = ChangelogGenerator(store, use_embeddings=True)
+            output = gen.generate("p")
+            scores = gen.differ.batch_embedding_similarity([("a", "a"), ("a", "bb")])
+        finally:
+            if old_mod is not None:
+                sys.modules["openai"] = old_mod
+            else:
+                sys.modules.pop("openai", None)
+
+        assert "Semantic similarity" in output
+        # One request for the changelog, one for the two new texts above.
+        assert mock_client.embeddings.create.call_count == 2
+        assert len(mock_client.embeddings.create.call_args_list[0].kwargs["input"]) == 4
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] < 1.0
+
+    def test_embedding_misses_are_sent_in_bounded_batches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import sys
+        import types
+
+        import promptdiff.diff as diff_mod
+
+        monkeypatch.setattr(diff_mod, "EMBEDDING_BATCH_SIZE", 3)
+        monkeypatch.setattr(diff_mod, "EMBEDDING_BATCH_CHARS", 10)
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = lambda input, model: MagicMock(
+            data=[MagicMock(embedding=[float(len(t)), 1.0]) for t in input]
+        )
+        fake_openai = types.ModuleType("openai")
+        fake_openai.OpenAI = MagicMock(return_value=mock_client)  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "openai", fake_openai)
+
+        d = PromptDiff()
+        pairs = [("a", "b"), ("c", "d"), ("e", "long text")]
+        scores = d.batch_embedding_similarity(pairs)
+        batches = [c.kwargs["input"] for c in mock_client.embeddings.create.call_args_list]
+        assert batches == [["a", "b", "c"], ["d", "e"], ["long text"]]
+        assert scores == d.batch_embedding_similarity(pairs)
+        assert mock_client.embeddings.create.call_count == 3
+
     def test_embedding_similarity_logic(self) -> None:
         """Test the cosine similarity math directly (bypass import)."""
         import numpy as np
@@ -139,6 +232,30 @@ class TestUnifiedDiff:
         assert "-line 2" in result
         assert "+line 2 modified" in result
 
+    def test_unified_diff_matches_difflib(self) -> None:
+        import difflib
+
+        old = "".join(f"line {i}\n" for i in range(20))
+        new = old.replace("line 3\n", "line three\n").replace("line 15\n", "")
+        expected = "".join(
+            difflib.unified_diff(
+                old.splitlines(keepends=True),
+                new.splitlines(keepends=True),
+                fromfile="v1",
+                tofile="v2",
+            )
+        )
+        assert PromptDiff().unified_diff(old, new, "v1", "v2") == expected
+
+    def test_unified_diff_from_result_reuses_diff(self) -> None:
+        d = PromptDiff()
+        old, new = "a\nb\nc\n", "a\nB\nc\n"
+        result = d.text_diff(old, new)
+        with patch.object(d, "text_diff", side_effect=AssertionError("diffed twice")):
+            rendered = d.unified_diff_from_result(result, "old", "new", context=0)
+        assert rendered == "--- old\n+++ new\n@@ -2 +2 @@\n-b\n+B\n"
+        assert d.unified_diff_from_result(d.text_diff(old, old)) == ""
+
 
 class TestFullDiff:
     """Test the full_diff method combining text + semantic."""
@@ -157,6 +274,131 @@ class TestFullDiff:
         assert not result.has_changes
 
 
+class TestFullDiffCache:
+    """Test memoization of full_diff results."""
+
+    def test_repeat_pair_skips_recompute(self) -> None:
+        d = PromptDiff()
+        first = d.full_diff("a\nb\n", "a\nc\n", 1, 2)
+        first.lines.clear()
+        first.stats["additions"] = 99
+        with patch.object(d, "text_diff", side_effect=AssertionError("recomputed")):
+            second = d.full_diff("a\nb\n", "a\nc\n", 3, 4)
+        assert (second.old_version, second.new_version) == (3, 4)
+        assert second.stats["additions"] == 1
+        assert len(second.lines) == 3
+        assert second.semantic_similarity == first.semantic_similarity
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from promptdiff import diff as diff_module
+
+        monkeypatch.setattr(diff_module, "FULL_DIFF_CACHE_SIZE", 2)
+        d = PromptDiff()
+        for i in range(5):
+            d.full_diff("x", f"y{i}")
+        assert len(d._full_diff_cache) == 2
+
+
+class TestMyersDiff:
+    """Test the fast Myers O(ND) diff path."""
+
+    def test_fast_matches_sequence_matcher_stats(self) -> None:
+        d = PromptDiff()
+        old = "line 1\nline 2\nline 3\nline 4\n"
+        new = "line 1\nline 2 changed\nline 3\nline 4\nline 5\n"
+        slow = d.text_diff(old, new)
+        fast = d.text_diff(old, new, fast=True)
+        assert fast.stats == slow.stats
+        assert [(line.tag, line.old_line, line.new_line) for line in fast.lines] == [
+            (line.tag, line.old_line, line.new_line) for line in slow.lines
+        ]
+        assert fast.similarity_ratio == pytest.approx(slow.similarity_ratio)
+
+    def test_fast_identical_and_empty(self) -> None:
+        d = PromptDiff()
+        assert d.text_diff("a\nb\n", "a\nb\n", fast=True).similarity_ratio == 1.0
+        assert d.text_diff("", "", fast=True).similarity_ratio == 1.0
+        assert d.text_diff("", "x\n", fast=True).stats["additions"] == 1
+
+    def test_myers_opcodes_reconstruct_new_text(self) -> None:
+        old = list("abcabba")
+        new = list("cbabac")
+        opcodes, distance = PromptDiff._myers_diff(old, new)
+        assert distance == 5  # the classic example from Myers' paper
+        rebuilt: list[str] = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            rebuilt.extend(old[i1:i2] if tag == "equal" else new[j1:j2])
+        assert rebuilt == new
+
+    def test_jitted_step_matches_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numba")
+        import random
+
+        from promptdiff import diff as diff_module
+
+        rng = random.Random(7)
+        old = [rng.choice("abcde") + "\n" for _ in range(300)]
+        new = [line if rng.random() > 0.1 else "x\n" for line in old][::-1][:280]
+        expected = PromptDiff._myers_diff(old, new)
+        monkeypatch.setattr(diff_module, "JIT_MIN_LINES", 0)
+        assert diff_module._jitted_myers_step() is not None
+        assert PromptDiff._myers_diff(old, new) == expected
+
+
+class TestTextDiffLines:
+    """Test diffing pre-split line sequences."""
+
+    def test_split_lines_is_memoized(self) -> None:
+        from promptdiff.diff import _split_lines
+
+        text = "alpha\nbeta\n"
+        assert _split_lines(text) is _split_lines(text)
+        assert _split_lines(text) == ("alpha\n", "beta\n")
+
+    def test_text_diff_lines_matches_text_diff(self) -> None:
+        d = PromptDiff()
+        old, new = "a\nb\nc\n", "a\nB\nc\nd\n"
+        from_text = d.text_diff(old, new, 1, 2)
+        from_lines = d.text_diff_lines(
+            old.splitlines(keepends=True), new.splitlines(keepends=True), 1, 2
+        )
+        assert from_lines.stats == from_text.stats
+        assert from_lines.similarity_ratio == from_text.similarity_ratio
+        assert len(from_lines.lines) == len(from_text.lines)
+
+
+class TestCommonAffixStripping:
+    """Test that shared leading/trailing lines are matched before diffing."""
+
+    def test_common_affixes(self) -> None:
+        from promptdiff.diff import _common_affixes
+
+        assert _common_affixes(["a", "b", "c"], ["a", "x", "c"]) == (1, 1)
+        assert _common_affixes(["a", "a"], ["a", "a", "a"]) == (2, 0)
+        assert _common_affixes([], ["a"]) == (0, 0)
+
+    def test_only_middle_reaches_matcher(self) -> None:
+        d = PromptDiff()
+        old = "".join(f"line {i}\n" for i in range(50))
+        new = old.replace("line 25\n", "line 25 edited\n")
+        with patch("promptdiff.diff.difflib.SequenceMatcher") as matcher_cls:
+            matcher_cls.return_value.get_opcodes.return_value = [("replace", 0, 1, 0, 1)]
+            matcher_cls.return_value.get_matching_blocks.return_value = []
+            result = d.text_diff(old, new)
+        args = matcher_cls.call_args.args
+        assert list(args[1]) == ["line 25\n"] and list(args[2]) == ["line 25 edited\n"]
+        assert result.stats == {"additions": 1, "deletions": 1, "modifications": 1}
+        assert result.similarity_ratio == pytest.approx(98 / 100)
+
+    def test_identical_text_skips_matcher(self) -> None:
+        d = PromptDiff()
+        with patch("promptdiff.diff.difflib.SequenceMatcher") as matcher_cls:
+            result = d.text_diff("a\nb\n", "a\nb\n")
+        matcher_cls.assert_not_called()
+        assert result.similarity_ratio == 1.0
+        assert [line.tag for line in result.lines] == ["equal", "equal"]
+
+
 class TestDiffLineDataclass:
     """Test DiffLine edge cases."""
 
@@ -172,6 +414,14 @@ class TestDiffLineDataclass:
         dl = DiffLine(tag="delete", old_line="removed")
         assert dl.new_line is None
 
+    def test_diff_line_is_slotted_and_frozen(self) -> None:
+        import dataclasses
+
+        dl = DiffLine(tag="equal", old_line="x", new_line="x")
+        assert not hasattr(dl, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dl.tag = "insert"  # type: ignore[misc]
+
 
 class TestTextDiffDeleteOpcode:
     """Test the delete opcode handler specifically (diff.py lines 75-77)."""
@@ -220,6 +470,21 @@ class TestDiffResultProperties:
         )
         assert not result.has_changes
 
+    def test_text_diff_fills_tag_array(self) -> None:
+        result = PromptDiff().text_diff("a\nb\nc\n", "a\nB\nc\nd\n")
+        assert bytes(result.tags) == b"ediei"
+        assert len(result.tags) == len(result.lines)
+        assert [line.tag[0] for line in result.lines] == list(result.tags.decode())
+        assert result.has_changes
+        assert not PromptDiff().text_diff("a\n", "a\n").has_changes
+
+    def test_stats_agree_with_lines(self) -> None:
+        result = PromptDiff().text_diff("a\nb\nc\nd\n", "x\nb\ny\nz\nd\ne\n")
+        tags = [line.tag for line in result.lines]
+        assert result.stats["additions"] == tags.count("insert") == 4
+        assert result.stats["deletions"] == tags.count("delete") == 2
+        assert result.stats["modifications"] == 2
+
 
 class TestScorerFunctions:
     """Direct tests for standalone scorer functions in eval.py."""
@@ -235,6 +500,29 @@ class TestScorerFunctions:
         score = similarity_scorer("hello world", "hello universe")
         assert 0.0 < score < 1.0
 
+    def test_similarity_scorer_matches_semantic_similarity(self) -> None:
+        pairs = [("a b c", "b c d"), ("The cat", "the CAT sat"), ("x", "y"), ("", "")]
+        for a, b in pairs:
+            assert similarity_scorer(a, b) == PromptDiff().semantic_similarity(a, b)
+        assert similarity_scorer("a b c", "b c d") == pytest.approx(2 / 4)
+
+    def test_similarity_scorer_reuses_token_sets(self) -> None:
+        from promptdiff.diff import _tokens
+
+        expected = "a repeated expected answer"
+        similarity_scorer("first output", expected)
+        hits = _tokens.cache_info().hits
+        similarity_scorer("second output", expected)
+        assert _tokens.cache_info().hits > hits
+        assert _tokens("Hello hello WORLD") == frozenset({"hello", "world"})
+
+    def test_shared_words_are_interned(self) -> None:
+        from promptdiff.diff import _tokens
+
+        (word_a,) = _tokens("Summarize")
+        (word_b,) = _tokens("SUMMARIZE")
+        assert word_a is word_b
+
     def test_exact_match_scorer_match(self) -> None:
         assert exact_match_scorer("hello", "hello") == 1.0
 
@@ -189,6 +189,25 @@ class TestEvalEdgeCases:
         result = EvalResult(prompt_name="p", version=1, details=[])
         assert result.weighted_score == 0.0
 
+    def test_parallel_runner_preserves_order(self) -> None:
+        import threading
+        import time
+
+        threads: set[int] = set()
+
+        def slow_runner(template: str, variables: dict[str, str]) -> str:
+            threads.add(threading.get_ident())
+            time.sleep(0.01 * (5 - int(variables["i"])))
+            return template.format(**variables)
+
+        evaluator = PromptEvaluator(runner=slow_runner, max_workers=4)
+        cases = [PromptTestCase(f"t{i}", {"i": str(i)}, f"item {i}") for i in range(5)]
+        result = evaluator.evaluate("p", 1, "item {i}", cases)
+        assert result.test_names == [f"t{i}" for i in range(5)]
+        assert [d["output"] for d in result.details] == [f"item {i}" for i in range(5)]
+        assert result.mean_score == 1.0
+        assert len(threads) > 1
+
     def test_compare_empty(self) -> None:
         evaluator = PromptEvaluator()
         result = evaluator.compare([])
@@ -224,3 +243,52 @@ class TestChangelogEdgeCases:
         gen = ChangelogGenerator(store)
         log = gen.generate_all()
         assert "No prompts" in log
+
+    def test_generate_all_layout(self, store: PromptStore) -> None:
+        store.add("a", "one", message="first")
+        store.add("b", "two", message="only")
+        gen = ChangelogGenerator(store)
+        log = gen.generate_all()
+        assert log.startswith("# Prompt Changelog\n\n# Changelog: a\n\n## v1 (")
+        assert log.endswith("- Initial version\n\n---\n")
+        assert log.count("\n---\n") == 2
+        assert gen.generate("b") in log
+
+    def test_generate_all_parallel_keeps_order(self, store: PromptStore) -> None:
+        names = [f"prompt-{i:02d}" for i in range(12)]
+        for name in names:
+            store.add(name, f"{name} line one\n", message="init")
+            store.add(name, f"{name} line one\nline two\n", message="grow")
+        gen = ChangelogGenerator(store)
+        expected = "# Prompt Changelog\n" + "".join(
+            f"\n{gen.generate(name)}\n---\n" for name in names
+        )
+        assert gen.generate_all() == expected
+
+    def test_generate_all_workers_do_not_nest_pools(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        for name in ("a", "b", "c"):
+            for i in range(4):
+                store.add(name, f"{name} {i}\n")
+        gen = ChangelogGenerator(store)
+        expected = "# Prompt Changelog\n" + "".join(
+            f"\n{gen.generate(name)}\n---\n" for name in ("a", "b", "c")
+        )
+        monkeypatch.setattr(store_mod, "PARALLEL_READ_MIN", 1)
+        monkeypatch.setattr(store_mod, "ThreadPoolExecutor", None)
+        assert gen.generate_all() == expected
+
+    def test_shared_differ_across_threads(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from promptdiff.diff import FULL_DIFF_CACHE_SIZE, PromptDiff
+
+        differ = PromptDiff()
+        pairs = [(f"a {i}\n", f"b {i % 5}\n") for i in range(FULL_DIFF_CACHE_SIZE * 3)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda p: differ.full_diff(*p), pairs))
+        assert all(r.has_changes for r in results)
+        assert len(differ._full_diff_cache) <= FULL_DIFF_CACHE_SIZE
@@ -0,0 +1,749 @@
+"""Extended tests for the store's metadata and content I/O paths."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from promptdiff.registry import PromptRegistry
+from promptdiff.store import PromptStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> PromptStore:
+    s = PromptStore(tmp_path)
+    s.init()
+    return s
+
+
+class TestBatchReadMeta:
+    """Test reading many prompts' metadata in one pass."""
+
+    def test_scan_returns_sorted_prompts(self, store: PromptStore) -> None:
+        store.add("beta", "b")
+        store.add("alpha", "a1")
+        store.add("alpha", "a2")
+        (store.prompts_path / "stray-dir").mkdir()
+
+        metas = store.batch_read_meta()
+        assert list(metas) == ["alpha", "beta"]
+        assert metas["alpha"]["latest_version"] == 2
+
+    def test_explicit_missing_name_raises(self, store: PromptStore) -> None:
+        store.add("alpha", "a")
+        with pytest.raises(FileNotFoundError, match="ghost"):
+            store.batch_read_meta(["alpha", "ghost"])
+
+    def test_registry_uses_batch(self, store: PromptStore) -> None:
+        registry = PromptRegistry(store)
+        registry.register("a", "x", tags=["prod"])
+        registry.register("b", "y", tags=["dev"])
+        assert registry.find_by_tag("prod") == ["a"]
+        assert [p["name"] for p in registry.list_all()] == ["a", "b"]
+
+
+class TestListPrompts:
+    """Test prompt discovery in list_prompts."""
+
+    def test_skips_files_and_dirs_without_meta(self, store: PromptStore) -> None:
+        store.add("zeta", "z")
+        store.add("alpha", "a")
+        (store.prompts_path / "half-created").mkdir()
+        (store.prompts_path / "notes.txt").write_text("not a prompt")
+        assert store.list_prompts() == ["alpha", "zeta"]
+
+
+class TestContentHash:
+    """Test the content hash recorded for each version."""
+
+    def test_hash_is_short_digest_of_store_algo(self, store: PromptStore) -> None:
+        from promptdiff.store import _content_digest_bytes
+
+        info = store.add("p", "hello")
+        assert info.content_hash == _content_digest_bytes(b"hello", store.hash_algo)[:12]
+        assert len(info.content_hash) == 12
+        assert store._read_meta("p")["hash_algo"] == store.hash_algo
+
+    def test_default_falls_back_to_blake2b(self) -> None:
+        import hashlib
+
+        from promptdiff.store import FAST_HASH_ALGO, _content_hash, blake3, xxhash
+
+        if blake3 is not None or xxhash is not None:
+            pytest.skip("a faster hash library is installed")
+        assert FAST_HASH_ALGO == "blake2b"
+        assert _content_hash("hello") == hashlib.blake2b(b"hello", digest_size=32).hexdigest()[:12]
+
+    def test_cryptographic_hash_uses_sha256(self, tmp_path: Path) -> None:
+        import hashlib
+
+        secure = PromptStore(tmp_path, cryptographic_hash=True)
+        secure.init()
+        info = secure.add("p", "hello")
+        assert info.content_hash == hashlib.sha256(b"hello").hexdigest()[:12]
+        assert secure._read_meta("p")["hash_algo"] == "sha256"
+
+    def test_cryptographic_hash_dedup_ignores_short_hash_collision(self, tmp_path: Path) -> None:
+        secure = PromptStore(tmp_path, cryptographic_hash=True)
+        secure.init()
+        first = secure.add("p", "prompt 28813176")
+        second = secure.add("p", "prompt 36896764")
+        assert first.content_hash == second.content_hash
+        assert second.version == 2
+        assert secure.get_version("p", 2).content == "prompt 36896764"
+
+    def test_algorithm_is_pinned_per_store(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        first = store.add("p", "same")
+        monkeypatch.setattr(store_mod, "FAST_HASH_ALGO", "sha256")
+        other = PromptStore(store.root)
+        assert other.hash_algo == store.hash_algo
+        assert other.add("q", "same").content_hash == first.content_hash
+        assert other.add("p", "same").version == 1
+
+    def test_cryptographic_hash_needs_a_sha256_store(self, store: PromptStore) -> None:
+        if store.hash_algo == "sha256":
+            pytest.skip("store already uses SHA-256")
+        secure = PromptStore(store.root, cryptographic_hash=True)
+        with pytest.raises(ValueError, match="cryptographic_hash"):
+            secure.add("p", "x")
+
+    def test_unpinned_store_uses_sha256(self, store: PromptStore) -> None:
+        import hashlib
+        import json
+
+        config_path = store.store_path / "promptdiff.json"
+        config = json.loads(config_path.read_text())
+        del config["hash_algo"]
+        config_path.write_text(json.dumps(config))
+        legacy = PromptStore(store.root)
+        assert legacy.add("p", "x").content_hash == hashlib.sha256(b"x").hexdigest()[:12]
+
+    def test_missing_pinned_algorithm(self, store: PromptStore) -> None:
+        import json
+
+        config_path = store.store_path / "promptdiff.json"
+        config = json.loads(config_path.read_text())
+        config["hash_algo"] = "not-installed"
+        config_path.write_text(json.dumps(config))
+        with pytest.raises(ImportError, match="fast"):
+            PromptStore(store.root).add("p", "x")
+
+    def test_text_and_bytes_hashes_agree(self) -> None:
+        from promptdiff.store import _content_hash, _content_hash_bytes
+
+        text = "héllo\nworld\n"
+        assert _content_hash_bytes(text.encode("utf-8")) == _content_hash(text)
+
+
+class TestDuplicateAdd:
+    """Test the duplicate-content path of PromptStore.add."""
+
+    def test_duplicate_reuses_parsed_meta(self, store: PromptStore) -> None:
+        from unittest.mock import patch
+
+        first = store.add("p", "same", message="v1")
+        with patch.object(store, "get_version", side_effect=AssertionError("re-read")):
+            again = store.add("p", "same", message="ignored")
+        assert again.version == first.version
+        assert again.message == "v1"
+        assert again.content == "same"
+
+    def test_duplicate_check_skips_version_file(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        store.add("p", "same")
+        latest_digest = store._read_meta("p")["latest_digest"]
+        assert latest_digest[:12] == store.get_version("p").content_hash
+        monkeypatch.setattr(store_mod, "_file_equals", None)
+        again = store.add("p", "same")
+        assert again.version == 1
+        assert again.content == "same"
+        assert store.add("p", "different").version == 2
+
+    def test_duplicate_returns_stored_version(self, store: PromptStore) -> None:
+        store.add("p", "same")
+        store._version_path("p", 1).unlink()
+        with pytest.raises(FileNotFoundError):
+            store.add("p", "same")
+
+    def test_short_hash_collision_is_not_a_duplicate(self, store: PromptStore) -> None:
+        from promptdiff.store import _content_hash
+
+        first = store.add("p", "one")
+        meta = dict(store._read_meta("p"))
+        meta["latest_digest"] = _content_hash("two", store.hash_algo) + "0" * 52
+        store._write_meta("p", meta)
+        second = store.add("p", "two")
+        assert second.version == 2
+        assert store.get_version("p", first.version).content == "one"
+
+    def test_legacy_meta_without_latest_digest(self, store: PromptStore) -> None:
+        store.add("p", "same")
+        meta = dict(store._read_meta("p"))
+        del meta["latest_digest"]
+        store._write_meta("p", meta)
+        assert store.add("p", "same").version == 1
+        assert store.add("p", "other").version == 2
+
+    def test_legacy_size_mismatch_skips_reading(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        store.add("p", "short")
+        meta = dict(store._read_meta("p"))
+        del meta["latest_digest"]
+        store._write_meta("p", meta)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("mapped a file of a different size")
+
+        monkeypatch.setattr(store_mod.mmap, "mmap", fail)
+        assert store.add("p", "much longer content").version == 2
+
+    def test_file_equals(self, tmp_path: Path) -> None:
+        from promptdiff.store import _file_equals
+
+        path = tmp_path / "f"
+        path.write_bytes(b"same bytes")
+        assert _file_equals(path, b"same bytes")
+        assert not _file_equals(path, b"same bytez")
+        assert not _file_equals(path, b"same")
+        path.write_bytes(b"")
+        assert _file_equals(path, b"")
+
+
+class TestVersionDate:
+    """Test the cached date shown by log and changelog."""
+
+    def test_date_is_timestamp_prefix(self) -> None:
+        from promptdiff.store import VersionInfo
+
+        v = VersionInfo(1, "x", timestamp="2024-03-05T10:00:00+00:00")
+        assert v.date == "2024-03-05"
+        assert "date" in vars(v)
+
+    def test_date_empty_without_timestamp(self) -> None:
+        from promptdiff.store import VersionInfo
+
+        v = VersionInfo(1, "x")
+        v.timestamp = ""
+        assert v.date == ""
+
+
+class TestMetaCache:
+    """Test the in-process cache of parsed meta.json files."""
+
+    def test_repeated_reads_reuse_parse(self, store: PromptStore) -> None:
+        from unittest.mock import patch
+
+        store.add("p", "x")
+        first = store._read_meta("p")
+        with patch("promptdiff.store._json_loads", side_effect=AssertionError("re-parsed")):
+            assert store._read_meta("p") is first
+            store.get_version("p")
+
+    def test_external_edit_is_picked_up(self, store: PromptStore) -> None:
+        import json
+        import os
+
+        store.add("p", "x")
+        meta_path = store._meta_path("p")
+        meta = json.loads(meta_path.read_text())
+        meta["tags"] = ["edited-elsewhere"]
+        meta_path.write_text(json.dumps(meta))
+        st = meta_path.stat()
+        os.utime(meta_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert store._read_meta("p")["tags"] == ["edited-elsewhere"]
+
+    def test_same_size_edit_within_one_tick_is_picked_up(self, store: PromptStore) -> None:
+        import os
+
+        from promptdiff.store import _atomic_write_bytes
+
+        store.add("p", "x")
+        meta_path = store._meta_path("p")
+        PromptRegistry(store).set_tags("p", ["a"])
+        st = meta_path.stat()
+        _atomic_write_bytes(meta_path, meta_path.read_bytes().replace(b'"a"', b'"b"'))
+        os.utime(meta_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert meta_path.stat().st_size == st.st_size
+        assert store._read_meta("p")["tags"] == ["b"]
+
+    def test_public_reads_return_copies(self, store: PromptStore) -> None:
+        registry = PromptRegistry(store)
+        registry.register("p", "x", tags=["a"])
+        metas = store.batch_read_meta()
+        metas["p"]["latest_version"] = 99
+        metas["p"]["tags"].append("leaked")
+        registry.get_tags("p").append("leaked")
+        registry.list_all()[0]["tags"].append("leaked")
+        assert store.batch_read_meta(["p"])["p"]["latest_version"] == 1
+        assert store.get_version("p").content == "x"
+        assert registry.get_tags("p") == ["a"]
+
+    def test_version_metadata_is_not_shared(self, store: PromptStore) -> None:
+        store.add("p", "x", metadata={"k": 1, "nested": {"a": 1}})
+        first = store.get_version("p", 1)
+        first.metadata["k"] = 99
+        first.metadata["nested"]["a"] = 99
+        store.list_versions("p")[0].metadata["k"] = 99
+        assert store.get_version("p", 1).metadata == {"k": 1, "nested": {"a": 1}}
+        assert store.list_versions("p", preload=True)[0].metadata["k"] == 1
+
+    def test_set_tags_leaves_cached_meta_alone(self, store: PromptStore) -> None:
+        registry = PromptRegistry(store)
+        registry.register("p", "x")
+        before = store._read_meta("p")
+        registry.set_tags("p", ["b"])
+        assert before["tags"] == []
+        assert registry.get_tags("p") == ["b"]
+
+    def test_delete_drops_cached_meta(self, store: PromptStore) -> None:
+        store.add("p", "x")
+        store._read_meta("p")
+        store.delete_prompt("p")
+        with pytest.raises(FileNotFoundError):
+            store._read_meta("p")
+        assert store.add("p", "fresh").version == 1
+
+
+class TestMetaJson:
+    """Test meta.json serialization with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(store_mod, "orjson", None)
+        store = PromptStore(tmp_path)
+        store.init()
+        store.add("p", "x", message="café", metadata={1: "int key"})
+        store._meta_cache.clear()
+        store._versions_cache.clear()
+        v = store.get_version("p")
+        assert v.message == "café"
+        assert v.metadata == {"1": "int key"}
+
+
+class TestVersionLog:
+    """Test the append-only versions.jsonl layout."""
+
+    def test_add_appends_one_line(self, store: PromptStore) -> None:
+        store.add("p", "one", message="first")
+        log_path = store._versions_path("p")
+        before = log_path.read_bytes()
+        store.add("p", "two", message="second")
+        after = log_path.read_bytes()
+
+        assert after.startswith(before)
+        assert after.count(b"\n") == 2
+        assert "versions" not in store._read_meta("p")
+        assert [v.message for v in store.list_versions("p")] == ["first", "second"]
+
+    def test_log_reread_after_cache_clear(self, store: PromptStore) -> None:
+        store.add("p", "one")
+        store.add("p", "two")
+        store._versions_cache.clear()
+        assert store.get_version("p", 1).content == "one"
+        assert store.get_version("p").version == 2
+
+    @pytest.mark.parametrize("clear_cache", [False, True])
+    def test_torn_last_line_is_dropped(self, store: PromptStore, clear_cache: bool) -> None:
+        store.add("p", "one")
+        store.add("p", "two")
+        with open(store._versions_path("p"), "ab") as f:
+            f.write(b'{"version": 3, "mess')
+        if clear_cache:
+            store._versions_cache.clear()
+        assert [v.version for v in store.list_versions("p")] == [1, 2]
+
+        store.add("p", "three")
+        store._versions_cache.clear()
+        versions = store.list_versions("p")
+        assert [(v.version, v.content) for v in versions] == [
+            (1, "one"),
+            (2, "two"),
+            (3, "three"),
+        ]
+
+    @pytest.mark.parametrize("clear_cache", [False, True])
+    def test_failed_meta_write_leaves_no_duplicate(
+        self, store: PromptStore, clear_cache: bool
+    ) -> None:
+        from unittest.mock import patch
+
+        store.add("p", "one")
+        with (
+            patch.object(store, "_write_meta", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            store.add("p", "two")
+        if clear_cache:
+            store._versions_cache.clear()
+        assert [v.version for v in store.list_versions("p")] == [1]
+        with pytest.raises(FileNotFoundError):
+            store.get_version("p", 2)
+
+        store.add("p", "two")
+        if clear_cache:
+            store._versions_cache.clear()
+        versions = store.list_versions("p")
+        assert [(v.version, v.content) for v in versions] == [(1, "one"), (2, "two")]
+
+    def test_get_version_uses_index(self, store: PromptStore) -> None:
+        for i in range(5):
+            store.add("p", f"v{i}", message=f"m{i}")
+        log = store._versions_cache["p"]
+        assert sorted(log.by_num) == [1, 2, 3, 4, 5]
+        assert log.by_num[3] is log.entries[2]
+        assert store.get_version("p", 3).message == "m2"
+
+        store._versions_cache.clear()
+        assert store.get_version("p", 4).message == "m3"
+        assert store._versions_cache["p"].by_num[4]["message"] == "m3"
+
+    def test_legacy_inline_versions_are_migrated(self, store: PromptStore) -> None:
+        import json
+
+        prompt_dir = store._prompt_dir("old")
+        prompt_dir.mkdir()
+        (prompt_dir / "v1.txt").write_text("legacy")
+        entry = {"version": 1, "message": "m", "timestamp": "2024-01-01T00:00:00+00:00",
+                 "content_hash": "abc", "metadata": {}}
+        meta = {"name": "old", "created": "", "tags": [], "versions": [entry],
+                "latest_version": 1}
+        (prompt_dir / "meta.json").write_text(json.dumps(meta))
+
+        assert store.get_version("old").content == "legacy"
+        assert store.add("old", "new").version == 2
+        assert "versions" not in json.loads((prompt_dir / "meta.json").read_text())
+        assert [v.version for v in store.list_versions("old")] == [1, 2]
+        assert store.get_version("old", 1).content_hash == "abc"
+
+
+class TestListVersionsReads:
+    """Test batched content reads in list_versions."""
+
+    def test_parallel_read_keeps_order(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        monkeypatch.setattr(store_mod, "PARALLEL_READ_MIN", 2)
+        for i in range(40):
+            store.add("p", f"content {i}")
+        versions = store.list_versions("p", preload=True)
+        assert [v.content for v in versions] == [f"content {i}" for i in range(40)]
+        assert [v.version for v in versions] == list(range(1, 41))
+
+
+class TestReadText:
+    """Test version reads through the reusable per-thread buffer."""
+
+    def test_matches_path_read_text(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import promptdiff.store as store_mod
+
+        monkeypatch.setattr(store_mod, "READ_BUFFER_MAX", 64)
+        cases = {
+            "empty": b"",
+            "unicode": "héllo wörld ✓\n".encode(),
+            "crlf": b"a\r\nb\rc\n",
+            "large": ("x" * 100 + "\n").encode() * 3,
+        }
+        for label, data in cases.items():
+            path = tmp_path / label
+            path.write_bytes(data)
+            assert store_mod._read_text(path) == path.read_text(encoding="utf-8"), label
+
+    def test_buffer_is_reused(self, tmp_path: Path) -> None:
+        import promptdiff.store as store_mod
+
+        (tmp_path / "a").write_text("first")
+        (tmp_path / "b").write_text("second, longer")
+        assert store_mod._read_text(tmp_path / "a") == "first"
+        buf = store_mod._read_buffers.buf
+        assert store_mod._read_text(tmp_path / "b") == "second, longer"
+        assert store_mod._read_buffers.buf is buf
+
+
+class TestLazyContent:
+    """Test that version contents are only read when used."""
+
+    def test_list_versions_does_not_read_bodies(self, store: PromptStore) -> None:
+        store.add("p", "one", message="first")
+        store.add("p", "two", message="second")
+        store._version_path("p", 1).unlink()
+
+        versions = store.list_versions("p")
+        assert [v.message for v in versions] == ["first", "second"]
+        assert versions[1].content == "two"
+        with pytest.raises(FileNotFoundError):
+            _ = versions[0].content
+
+    def test_get_version_reads_on_access(self, store: PromptStore) -> None:
+        store.add("p", "original")
+        v = store.get_version("p")
+        path = store._version_path("p", 1)
+        path.unlink()
+        path.write_text("rewritten")
+        assert v.content == "rewritten"
+        assert v.content == "rewritten"
+
+    def test_plain_version_info_defaults_to_empty(self) -> None:
+        from promptdiff.store import VersionInfo
+
+        assert VersionInfo.from_dict({"version": 1}).content == ""
+
+
+class TestContentObjects:
+    """Test the content-addressed object store behind version files."""
+
+    def test_weak_hash_collisions_are_byte_checked(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import json
+
+        import promptdiff.store as store_mod
+
+        class Colliding:
+            def update(self, data: bytes) -> None:
+                pass
+
+            def hexdigest(self) -> str:
+                return "0" * 64
+
+        monkeypatch.setitem(store_mod._HASH_FACTORIES, "colliding", Colliding)
+        config_path = store.store_path / "promptdiff.json"
+        config = json.loads(config_path.read_text())
+        config["hash_algo"] = "colliding"
+        config_path.write_text(json.dumps(config))
+        store = PromptStore(store.root)
+        assert store.add("p", "one").version == 1
+        assert store.add("p", "two").version == 2
+        assert store.add("q", "three").version == 1
+        assert [v.content for v in store.list_versions("p")] == ["one", "two"]
+        assert store.get_version("q").content == "three"
+        assert store.add("p", "two").version == 2
+
+    def test_content_is_encoded_once(self, store: PromptStore) -> None:
+        class CountingStr(str):
+            encodes = 0
+
+            def encode(self, *args: object, **kwargs: object) -> bytes:
+                CountingStr.encodes += 1
+                return super().encode(*args, **kwargs)  # type: ignore[arg-type]
+
+        store.add("p", CountingStr("naïve content"))
+        assert CountingStr.encodes == 1
+        assert store._version_path("p", 1).read_bytes() == "naïve content".encode()
+
+    def test_identical_content_shares_one_object(self, store: PromptStore) -> None:
+        store.add("a", "shared boilerplate")
+        store.add("b", "shared boilerplate")
+        inode_a = store._version_path("a", 1).stat().st_ino
+        assert store._version_path("b", 1).stat().st_ino == inode_a
+        assert len([p for p in store.objects_path.rglob("*") if p.is_file()]) == 1
+
+    def test_delete_collects_unreferenced_objects(self, store: PromptStore) -> None:
+        store.add("a", "shared")
+        store.add("a", "only in a")
+        store.add("b", "shared")
+
+        store.delete_prompt("a")
+        objects = [p for p in store.objects_path.rglob("*") if p.is_file()]
+        assert len(objects) == 1
+        assert store.get_version("b").content == "shared"
+
+        store.delete_prompt("b")
+        assert not [p for p in store.objects_path.rglob("*") if p.is_file()]
+
+    def test_falls_back_to_copy_without_hard_links(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import os
+
+        def no_link(src: object, dst: object) -> None:
+            raise OSError("hard links not supported")
+
+        monkeypatch.setattr(os, "link", no_link)
+        store.add("p", "copied")
+        assert store.get_version("p").content == "copied"
+        assert store._version_path("p", 1).stat().st_nlink == 1
+
+
+class TestDurableWrites:
+    """Test fsync behaviour of durable stores and batch()."""
+
+    def _count_fsyncs(self, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        import os
+
+        calls: list[int] = []
+        real_fsync = os.fsync
+
+        def counting_fsync(fd: int) -> None:
+            calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", counting_fsync)
+        return calls
+
+    def test_default_store_never_fsyncs(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._count_fsyncs(monkeypatch)
+        store.add("p", "one")
+        store.add("p", "two")
+        assert calls == []
+
+    def test_batch_shares_fsyncs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        durable = PromptStore(tmp_path, durable=True)
+        durable.init()
+        calls = self._count_fsyncs(monkeypatch)
+
+        durable.add("single", "v0")
+        per_add = len(calls)
+        assert per_add > 0
+
+        calls.clear()
+        with durable.batch():
+            for i in range(10):
+                durable.add("bulk", f"v{i}")
+            # Only each meta.json is synced before its rename.
+            assert len(calls) == 10
+        assert 10 < len(calls) < 10 * per_add
+        assert durable.get_version("bulk").content == "v9"
+
+    def test_batch_syncs_meta_before_rename(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import os
+
+        durable = PromptStore(tmp_path, durable=True)
+        durable.init()
+        events: list[str] = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd: int) -> None:
+            events.append("fsync")
+            real_fsync(fd)
+
+        def replace(src: str, dst: str) -> None:
+            events.append(f"replace {Path(dst).name}")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        monkeypatch.setattr(os, "replace", replace)
+        with durable.batch():
+            durable.add("p", "x")
+            assert events == ["fsync", "replace meta.json"]
+
+    def test_no_temp_files_left_behind(self, tmp_path: Path) -> None:
+        durable = PromptStore(tmp_path, durable=True)
+        durable.init()
+        durable.add("p", "x")
+        durable.add("p", "y")
+        assert not list(durable.store_path.rglob("*.tmp"))
+
+
+class TestAddHotPath:
+    """Test that appending a version only touches the prompt's head metadata."""
+
+    def test_add_does_not_read_version_log(self, store: PromptStore) -> None:
+        from unittest.mock import patch
+
+        from promptdiff.store import _json_loads
+
+        store.add("p", "one")
+        with (
+            patch.object(store, "_read_versions", side_effect=AssertionError("log read")),
+            patch("promptdiff.store._json_loads", wraps=_json_loads) as loads,
+        ):
+            info = store.add("p", "two")
+        assert info.version == 2
+        # Only the appended entry itself is parsed back, for the log cache.
+        assert loads.call_count == 1
+
+    def test_new_content_is_written_without_rename(
+        self, store: PromptStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import os
+
+        store.add("p", "one")
+        renamed: list[str] = []
+        real_replace = os.replace
+
+        def tracking_replace(src: str, dst: str) -> None:
+            renamed.append(os.path.basename(dst))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", tracking_replace)
+        store.add("p", "two")
+        assert renamed == ["meta.json"]
+        assert store._version_path("p", 2).stat().st_nlink == 2
+
+    def test_add_after_external_log_append_refreshes_cache(self, store: PromptStore) -> None:
+        store.add("p", "one")
+        store.list_versions("p")
+        with open(store._versions_path("p"), "ab") as f:
+            f.write(b"\n")
+        store.add("p", "two")
+        assert [v.version for v in store.list_versions("p")] == [1, 2]
+
+
+class TestCompressedStore:
+    """Test opt-in zstd compression of version contents."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        pytest.importorskip("zstandard")
+        store = PromptStore(tmp_path, compress=True)
+        store.init()
+        text = "You are a helpful assistant.\n" * 200
+        store.add("p", text, message="first")
+        store.add("p", text + "Be brief.\n", message="second")
+
+        path = store._version_path("p", 1, compressed=True)
+        assert path.is_file()
+        assert not store._version_path("p", 1).exists()
+        assert path.stat().st_size < len(text)
+
+        reopened = PromptStore(tmp_path)
+        assert reopened.get_version("p", 1).content == text
+        assert [v.message for v in reopened.list_versions("p", preload=True)] == [
+            "first",
+            "second",
+        ]
+        assert reopened.add("p", text + "Be brief.\n").version == 2
+
+    def test_mixed_with_plain_versions(self, store: PromptStore) -> None:
+        pytest.importorskip("zstandard")
+        store.add("p", "plain")
+        compressed = PromptStore(store.root, compress=True)
+        compressed.add("p", "squeezed")
+        assert [v.content for v in store.list_versions("p")] == ["plain", "squeezed"]
+
+        assert PromptStore(store.root).add("p", "squeezed").version == 2
+
+        store.delete_prompt("p")
+        assert not [p for p in store.objects_path.rglob("*") if p.is_file()]
+
+    def test_requires_zstandard(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import sys
+
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        with pytest.raises(ImportError, match="compress"):
+            PromptStore(tmp_path, compress=True)